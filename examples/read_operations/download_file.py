@@ -1,4 +1,3 @@
-from sharepycrud.readClient import ReadClient
 from sharepycrud.config import SharePointConfig
 import os
 from sharepycrud.logger import setup_logging
@@ -12,20 +11,22 @@ def main() -> None:
     config = SharePointConfig.from_env()
     read_client = ClientFactory.create_read_client(config)
 
-    # Download and save file
-    file_content = read_client.download_file(
-        file_path="Willem Seethaler Resume 2024.docx",
-        site_name="TestSite1",
-        drive_name="Files",
+    save_path = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)),
+        "Willem Seethaler Resume 2024.docx",
     )
 
-    if file_content:
-        save_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "Willem Seethaler Resume 2024.docx",
+    # Stream the file straight to disk instead of buffering it in memory
+    with open(save_path, "wb") as f:
+        downloaded = read_client.download_file_to(
+            file_path="Willem Seethaler Resume 2024.docx",
+            site_name="TestSite1",
+            drive_name="Files",
+            dest=f,
         )
-        with open(save_path, "wb") as f:
-            f.write(file_content)
+
+    if not downloaded:
+        os.remove(save_path)
 
 
 if __name__ == "__main__":
@@ -1,47 +1,156 @@
-from typing import Dict, Any, Optional, cast, List, Union
+from typing import (
+    Dict,
+    Any,
+    Collection,
+    Iterator,
+    Optional,
+    Tuple,
+    cast,
+    List,
+    Union,
+    overload,
+)
+from functools import partial
+import random
+import time
+from threading import Lock
+import orjson
 import requests
-from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote, urlencode
 from sharepycrud.config import SharePointConfig
 from sharepycrud.logger import get_logger
 
 logger = get_logger("sharepycrud.baseClient")
 
+_GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0/"
+# Path segments are encoded whole, slashes included
+_QUOTE = partial(quote, safe="")
+
+# Graph throttling: retry 429/503 honoring Retry-After, else capped exponential backoff
+_MAX_ATTEMPTS = 5
+_RETRY_STATUSES = (429, 503)
+_MAX_BACKOFF = 32.0
+
+_GRAPH_SCOPE = "https://graph.microsoft.com/.default"
+# Sent with Graph API calls only; downloads keep the session's Accept: */*
+_JSON_ACCEPT = {"Accept": "application/json"}
+# Tokens are reused until shortly before they expire
+_TOKEN_EXPIRY_MARGIN = 60.0
+_DEFAULT_TOKEN_LIFETIME = 3599.0
+
+# Connections kept open per host; ReadClient's worker pools stay within it
+_POOL_MAXSIZE = 16
+
 
 class BaseClient:
+    # Access tokens shared across clients, keyed by (tenant, client ID, scope)
+    _token_cache: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+    _token_cache_lock = Lock()
+
     def __init__(self, config: SharePointConfig):
         """
         Initialize BaseClient with configuration.
         Automatically fetches an access token during initialization.
         """
         self.config = config
+        # Shared keep-alive session so downloads reuse pooled connections
+        self.session = self._create_session()
         self.access_token = self._get_access_token()
         if not self.access_token:
             logger.error("Failed to obtain access token during initialization")
             raise ValueError("Failed to obtain access token")
 
-    # Using a direct requests.post call rather than self.make_graph_request
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Build the pooled session shared by all requests from this client."""
+        session = requests.Session()
+        # Transport errors and gateway failures are retried below the pool;
+        # throttling responses are handled by make_graph_request
+        transport_retry = Retry(
+            total=_MAX_ATTEMPTS,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 504),
+            raise_on_status=False,
+            # Otherwise urllib3 retries any 429/503 carrying Retry-After itself
+            respect_retry_after_header=False,
+        )
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=_POOL_MAXSIZE, max_retries=transport_retry),
+        )
+        return session
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Current bearer token; setting it also updates the session headers."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: Optional[str]) -> None:
+        self._access_token = token
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    @classmethod
+    def clear_token_cache(cls) -> None:
+        """Forget all cached access tokens so the next client requests a new one."""
+        with cls._token_cache_lock:
+            cls._token_cache.clear()
+
+    def _token_cache_key(self) -> Tuple[str, str, str]:
+        return (self.config.tenant_id, self.config.client_id, _GRAPH_SCOPE)
+
+    def _refresh_access_token(self) -> None:
+        """Drop this client's cached token and fetch a new one."""
+        with self._token_cache_lock:
+            self._token_cache.pop(self._token_cache_key(), None)
+        self.access_token = self._get_access_token()
+
+    # Posting through the session directly rather than self.make_graph_request
     # to avoid bootstrapping issue with self.make_graph_request.
     def _get_access_token(self) -> Optional[str]:
         """
         Retrieve an access token using Azure AD client credentials flow.
+
+        A cached token for the same tenant, client and scope is reused until
+        shortly before it expires.
         """
+        cache_key = self._token_cache_key()
+        cached = self._token_cache.get(cache_key)
+        if cached and time.monotonic() < cached[1]:
+            logger.debug("Using cached access token")
+            return cached[0]
+
         url = f"https://login.microsoftonline.com/{self.config.tenant_id}/oauth2/v2.0/token"
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        # A None value drops the session's stale bearer token from this request
+        headers: Dict[str, Optional[str]] = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": None,
+        }
         body = {
             "grant_type": "client_credentials",
             "client_id": self.config.client_id,
             "client_secret": self.config.client_secret,
-            "scope": "https://graph.microsoft.com/.default",
+            "scope": _GRAPH_SCOPE,
         }
 
         try:
-            # Make a direct requests.post call without depending on self.access_token
-            response = requests.post(url, headers=headers, data=body)
+            # Reuse the pooled session without depending on self.access_token
+            response = self.session.post(url, headers=headers, data=body)
             response.raise_for_status()
-            token = cast(Optional[str], response.json().get("access_token"))
+            payload = self._decode_json(response)
+            token = cast(Optional[str], payload.get("access_token"))
 
             if token:
                 logger.debug("Successfully obtained access token")
+                lifetime = float(payload.get("expires_in", _DEFAULT_TOKEN_LIFETIME))
+                expires_at = time.monotonic() + lifetime - _TOKEN_EXPIRY_MARGIN
+                with self._token_cache_lock:
+                    self._token_cache[cache_key] = (token, expires_at)
                 return token
 
             logger.error("No access token in response")
@@ -58,13 +167,35 @@ class BaseClient:
             logger.error(f"Failed to get access token: {str(e)}")
             raise ValueError("Failed to obtain access token")
 
+    @overload
+    def make_graph_request(
+        self,
+        url: str,
+        method: str = ...,
+        data: Optional[Union[Dict[str, Any], bytes]] = ...,
+        headers: Optional[Dict[str, str]] = ...,
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    def make_graph_request(
+        self,
+        url: str,
+        method: str = ...,
+        data: Optional[Union[Dict[str, Any], bytes]] = ...,
+        headers: Optional[Dict[str, str]] = ...,
+        *,
+        allowed_statuses: Collection[int],
+    ) -> Optional[Dict[str, Any]]: ...
+
     def make_graph_request(
         self,
         url: str,
         method: str = "GET",
         data: Optional[Union[Dict[str, Any], bytes]] = None,  # Allow Dict or bytes
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        *,
+        allowed_statuses: Collection[int] = (),
+    ) -> Optional[Dict[str, Any]]:
         """
         Generic function to make Microsoft Graph API requests.
 
@@ -72,10 +203,14 @@ class BaseClient:
             url: URL of the API request.
             method: HTTP method to use (default is GET).
             data: Data to send with the request (can be dict or bytes).
-            headers: Optional headers to include in the request.
+            headers: Optional headers to merge over the session defaults.
+            allowed_statuses: Error statuses that are an expected answer rather
+                than a failure (e.g. 404 for an existence check). They are
+                returned as None without raising or logging an error.
 
         Returns:
-            The response from the API request as a dictionary.
+            The response from the API request as a dictionary, or None for a
+            status in allowed_statuses.
 
         Raises:
             ValueError: If access token is missing or invalid
@@ -85,23 +220,41 @@ class BaseClient:
             logger.error("Access token is missing or invalid")
             raise ValueError("Access token is missing or invalid")
 
-        default_headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Accept": "application/json",
-        }
-
-        if headers:
-            default_headers.update(headers)
-
         try:
             logger.debug(f"Making {method} request to {url}")
-            response = requests.request(
-                method,
-                url,
-                headers=default_headers,
-                json=data if isinstance(data, dict) else None,
-                data=data if isinstance(data, bytes) else None,
-            )
+            token_refreshed = False
+            for attempt in range(_MAX_ATTEMPTS):
+                response = self.session.request(
+                    method,
+                    url,
+                    # Authorization comes from the session defaults
+                    headers={**_JSON_ACCEPT, **headers} if headers else _JSON_ACCEPT,
+                    json=data if isinstance(data, dict) else None,
+                    data=data if isinstance(data, bytes) else None,
+                )
+                # An expired or revoked token gets one refresh before failing
+                if response.status_code == 401 and not token_refreshed:
+                    logger.info("Access token rejected, requesting a new one")
+                    self._refresh_access_token()
+                    token_refreshed = True
+                    continue
+
+                if (
+                    response.status_code not in _RETRY_STATUSES
+                    or attempt == _MAX_ATTEMPTS - 1
+                ):
+                    break
+
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"Request throttled ({response.status_code}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+            if response.status_code in allowed_statuses:
+                logger.debug(f"Request returned {response.status_code}: {method} {url}")
+                return None
+
             response.raise_for_status()
 
             # For non-JSON responses, just return an empty dict
@@ -110,12 +263,13 @@ class BaseClient:
             ):
                 return {}
 
-            result = cast(Dict[str, Any], response.json())
+            result = cast(Dict[str, Any], self._decode_json(response))
             logger.debug(f"Request successful: {method} {url}")
             return result
 
         except requests.exceptions.HTTPError as e:
-            if e.response:
+            # Error responses are falsy, so compare against None explicitly
+            if e.response is not None:
                 logger.error(
                     f"HTTP error in request: {e.response.status_code} - {e.response.reason}"
                 )
@@ -129,25 +283,83 @@ class BaseClient:
             logger.debug(f"Failed URL: {url}")
             raise
 
-    def format_graph_url(self, base_path: str, *args: str) -> str:
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a throttled request.
+
+        Uses the Retry-After header when it is given in seconds, otherwise
+        an exponential backoff with jitter capped at _MAX_BACKOFF.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return min(2.0**attempt, _MAX_BACKOFF) * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Any:
+        """
+        Decode a JSON response body.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON,
+                matching what response.json() raises
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    def iter_graph_pages(self, url: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the items of a Graph collection, following @odata.nextLink.
+
+        Pages are fetched lazily, so callers that stop iterating early
+        skip the remaining requests.
+
+        Args:
+            url: URL of the first page of the collection.
+
+        Yields:
+            Each item in the collection's "value" arrays.
+        """
+        next_url: Optional[str] = url
+        while next_url:
+            response = self.make_graph_request(next_url)
+            yield from response.get("value", [])
+            next_url = response.get("@odata.nextLink")
+            if next_url:
+                logger.debug(f"Following next page: {next_url}")
+
+    def format_graph_url(
+        self, base_path: str, *args: str, query: Optional[Dict[str, str]] = None
+    ) -> str:
         """
         Format Microsoft Graph API URL with proper encoding.
 
         Args:
             base_path: Base path of the API request.
             args: Additional path components to append to the base path.
+            query: Optional OData query parameters (e.g. {"$select": "id,name"}).
 
         Returns:
             The formatted URL.
         """
         try:
-            encoded_args = [quote(str(arg), safe="") for arg in args]
             if not args:
-                url = f"https://graph.microsoft.com/v1.0/{base_path}"
+                url = _GRAPH_BASE_URL + base_path
             else:
-                url = f"https://graph.microsoft.com/v1.0/{base_path}/{'/'.join(encoded_args)}"
+                encoded_path = "/".join(_QUOTE(a) for a in args)
+                url = f"{_GRAPH_BASE_URL}{base_path}/{encoded_path}"
+
+            if query:
+                url = f"{url}?{urlencode(query, safe='$,', quote_via=quote)}"
 
-            logger.debug(f"Formatted Graph API URL: {url}")
+            # Lazy formatting: this runs for every request
+            logger.debug("Formatted Graph API URL: %s", url)
             return url
 
         except Exception as e:
@@ -32,6 +32,9 @@ class ClientFactory:
     def create_read_client(cls, config: SharePointConfig) -> ReadClient:
         """
         Create a ReadClient instance using the shared BaseClient.
+
+        Each call returns a new ReadClient with an empty ID cache; keep and
+        reuse one instance so repeated site, drive and folder lookups hit it.
         """
         base_client = cls.get_base_client(config)
         return ReadClient(base_client)
@@ -6,10 +6,18 @@ from sharepycrud.loggerConfig import LogConfig
 
 def setup_logging(
     level: Union[int, str] = "INFO",
-    log_file: Optional[str] = None,
+    log_file: Optional[Union[str, TextIO]] = None,
     use_colors: bool = True,
 ) -> None:
-    """Configure package-wide logging settings with environment aware settings."""
+    """
+    Configure package-wide logging settings with environment aware settings.
+
+    Args:
+        level: Logging level name or number (default: "INFO")
+        log_file: Path of a log file, or an open text stream, that also receives
+            records in the uncolored file format
+        use_colors: Color console output when stdout is a TTY (default: True)
+    """
 
     root_logger = logging.getLogger("sharepycrud")
 
@@ -33,7 +41,11 @@ def setup_logging(
     root_logger.addHandler(console_handler)
 
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler: logging.Handler
+        if isinstance(log_file, str):
+            file_handler = logging.FileHandler(log_file)
+        else:
+            file_handler = logging.StreamHandler(log_file)
         file_handler.setFormatter(LogConfig.get_file_formatter())
         root_logger.addHandler(file_handler)
 
@@ -1,16 +1,82 @@
-from sharepycrud.baseClient import BaseClient
+from sharepycrud.baseClient import BaseClient, _POOL_MAXSIZE
 from sharepycrud.config import SharePointConfig
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, BinaryIO, Iterator, Deque, cast
+from io import BytesIO
+from collections import OrderedDict, deque
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+import os
+import time
+from urllib.parse import quote
 import requests
 from requests import Response
 from sharepycrud.logger import get_logger
 
 logger = get_logger("sharepycrud.readClient")
 
+# Ranged downloads: bytes per request and concurrent requests per file
+_PART_SIZE = 8 << 20
+_MAX_WORKERS = 8
+
+# Concurrent per-drive listing requests in list_drives_and_root_contents,
+# bounded by the session's connection pool so every worker keeps its connection
+_MAX_LISTING_WORKERS = _POOL_MAXSIZE
+
+# Name-to-ID lookups rarely change, so resolved IDs are reused for an hour
+_ID_CACHE_TTL = 3600.0
+_ID_CACHE_MAXSIZE = 512
+
+# Only request the fields the listing methods read, in pages as large as Graph allows
+_ID_NAME_QUERY = {"$select": "id,name"}
+_ITEM_QUERY = {
+    "$select": "id,name,folder,file,webUrl,size,parentReference",
+    "$top": "999",
+}
+
 
 class ReadClient:
     def __init__(self, base_client: BaseClient):
         self.client = base_client
+        # Per instance: reuse one ReadClient to benefit from cached lookups
+        self._id_cache: OrderedDict[Tuple[str, ...], Tuple[str, float]] = OrderedDict()
+        self._id_cache_lock = Lock()
+
+    def invalidate_caches(self) -> None:
+        """Drop all cached site, drive and folder ID lookups."""
+        with self._id_cache_lock:
+            self._id_cache.clear()
+
+    def _get_cached_id(self, key: Tuple[str, ...]) -> Optional[str]:
+        """Return a cached ID, or None if it is missing or expired."""
+        with self._id_cache_lock:
+            entry = self._id_cache.get(key)
+            if entry is None:
+                return None
+
+            cached_id, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._id_cache[key]
+                return None
+
+            self._id_cache.move_to_end(key)
+            return cached_id
+
+    def _cache_id(self, key: Tuple[str, ...], resolved_id: str) -> None:
+        """Cache a resolved ID, evicting the least recently used entry when full."""
+        with self._id_cache_lock:
+            if key in self._id_cache:
+                self._id_cache.move_to_end(key)
+            elif len(self._id_cache) >= _ID_CACHE_MAXSIZE:
+                self._id_cache.popitem(last=False)
+            self._id_cache[key] = (resolved_id, time.monotonic() + _ID_CACHE_TTL)
+
+    def _iter_values(self, response: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the items of a fetched page, then lazily follow @odata.nextLink."""
+        yield from response.get("value", [])
+        next_link = response.get("@odata.nextLink")
+        if next_link:
+            yield from self.client.iter_graph_pages(next_link)
 
     ### Delegate methods to BaseClient
     def make_graph_request(
@@ -70,13 +136,13 @@ class ReadClient:
         if not self.client.access_token:
             return None
 
-        url = self.client.format_graph_url("sites")
+        url = self.client.format_graph_url("sites", query=_ID_NAME_QUERY)
         response = self.client.make_graph_request(url)
 
         if response is None:
             return None
 
-        site_names = [site.get("name") for site in response.get("value", [])]
+        site_names = [site.get("name") for site in self._iter_values(response)]
         logger.info(f"Found {len(site_names)} sites")
         logger.info(f"Site names: {site_names}")
         return site_names
@@ -101,19 +167,25 @@ class ReadClient:
             return None
 
         base_url = sharepoint_url or self.client.config.sharepoint_url
+        cache_key = ("site", base_url, site_name)
+        cached_id = self._get_cached_id(cache_key)
+        if cached_id:
+            return cached_id
+
         url = self.client.format_graph_url(f"sites/{base_url}:/sites/{site_name}")
 
         response = self.client.make_graph_request(url)
         if not response:
             return None
 
-        site_id = response.get("id")
-        if isinstance(site_id, str):
-            logger.info(f"Found site: {site_name}")
-            logger.info(f"Site ID: {site_id}")
-            return site_id
+        site_id = cast(Optional[str], response.get("id"))
+        if not site_id:
+            return None
 
-        return None
+        logger.info(f"Found site: {site_name}")
+        logger.info(f"Site ID: {site_id}")
+        self._cache_id(cache_key, site_id)
+        return site_id
 
     def list_drive_names(self, site_id: str) -> Optional[List[str]]:
         """List all drive names for a site.
@@ -127,12 +199,16 @@ class ReadClient:
         if not self.client.access_token:
             return None
 
-        url = self.client.format_graph_url("sites", site_id, "drives")
+        url = self.client.format_graph_url(
+            "sites", site_id, "drives", query=_ID_NAME_QUERY
+        )
         response = self.client.make_graph_request(url)
         if not response:
             return None
 
-        drive_names = [drive.get("name") for drive in response.get("value", [])]
+        drive_names: List[Any] = [
+            drive.get("name") for drive in self._iter_values(response)
+        ]
         logger.info(f"Found {len(drive_names)} drives")
         logger.info(f"Drive names: {drive_names}")
         return drive_names
@@ -155,18 +231,27 @@ class ReadClient:
         if not response:
             return None
 
-        logger.info(f"Found {len(response.get('value', []))} drives")
+        drives = list(self._iter_values(response))
+        response["value"] = drives
+        response.pop("@odata.nextLink", None)
+        logger.info(f"Found {len(drives)} drives")
 
-        for drive in response.get("value", []):
-            logger.info(f"Processing drive: {drive['name']}")
+        if drives:
+            # The root listings are independent, so fetch them concurrently
+            workers = min(_MAX_LISTING_WORKERS, len(drives))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                root_items = list(
+                    executor.map(
+                        lambda drive: self._list_root_items(drive["id"]), drives
+                    )
+                )
+        else:
+            root_items = []
 
-            root_url = self.client.format_graph_url(
-                "drives", drive["id"], "root", "children"
-            )
-            root_contents = self.client.make_graph_request(root_url)
+        for drive, items in zip(drives, root_items):
+            logger.info(f"Processing drive: {drive['name']}")
 
-            if root_contents:
-                items = root_contents.get("value", [])
+            if items is not None:
                 folders = sum(1 for item in items if "folder" in item)
                 files = len(items) - folders
                 logger.info(
@@ -175,6 +260,16 @@ class ReadClient:
 
         return response
 
+    def _list_root_items(self, drive_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Fetch every item in a drive's root folder, or None if the request fails."""
+        root_url = self.client.format_graph_url(
+            "drives", drive_id, "root", "children", query=_ITEM_QUERY
+        )
+        root_contents = self.client.make_graph_request(root_url)
+        if not root_contents:
+            return None
+        return list(self._iter_values(root_contents))
+
     def get_drive_id(self, site_id: str, drive_name: str) -> Optional[str]:
         """Get drive ID by its name.
 
@@ -188,19 +283,25 @@ class ReadClient:
         if not self.client.access_token:
             return None
 
-        url = self.client.format_graph_url("sites", site_id, "drives")
+        cache_key = ("drive", site_id, drive_name)
+        cached_id = self._get_cached_id(cache_key)
+        if cached_id:
+            return cached_id
+
+        url = self.client.format_graph_url(
+            "sites", site_id, "drives", query=_ID_NAME_QUERY
+        )
         response = self.client.make_graph_request(url)
 
         if not response:
             return None
 
-        drives: List[Dict[str, Any]] = response.get("value", [])
-        for drive in drives:
-            if isinstance(drive, dict) and drive.get("name") == drive_name:
-                drive_id = drive.get("id")
-                if isinstance(drive_id, str):
-                    logger.info(f"Found drive: {drive_name}, ID: {drive_id}")
-                    return drive_id
+        for drive in self._iter_values(response):
+            if drive.get("name") == drive_name:
+                drive_id = cast(str, drive["id"])
+                logger.info(f"Found drive: {drive_name}, ID: {drive_id}")
+                self._cache_id(cache_key, drive_id)
+                return drive_id
 
         logger.info(f"Drive not found: {drive_name}")
         return None
@@ -216,52 +317,61 @@ class ReadClient:
         """
         if not self.client.access_token:
             return []
-        url = self.client.format_graph_url("sites", site_id, "drives")
+        url = self.client.format_graph_url(
+            "sites", site_id, "drives", query=_ID_NAME_QUERY
+        )
         response = self.client.make_graph_request(url)
-        drives = response.get("value", []) if response else []
+        drives = list(self._iter_values(response)) if response else []
         logger.info(f"Found {len(drives)} drives")
         return [(drive["id"], drive["name"]) for drive in drives]
 
     def list_all_folders(
         self, drive_id: str, parent_path: str = "root", level: int = 0
     ) -> List[Dict[str, Any]]:
-        """Recursively list all folders within a drive.
+        """List all folders within a drive, breadth-first.
 
         Args:
             drive_id: ID of the drive.
-            parent_path: Path of the parent folder.
-            level: Current level of recursion.
+            parent_path: ID of the folder to start from (defaults to the drive root).
+            level: Depth reported for the starting folder's children.
 
         Returns:
-            A list of folders within the specified parent path.
+            A list of folders below the starting folder, ordered level by level.
         """
         if not self.client.access_token:
             return []
 
-        url = self.client.format_graph_url(
-            "drives", drive_id, "items", parent_path, "children"
+        folders: List[Dict[str, Any]] = []
+        # Each entry is (folder ID, folder name, depth of its children)
+        pending: Deque[Tuple[str, Optional[str], int]] = deque(
+            [(parent_path, None, level)]
         )
-        response = self.client.make_graph_request(url)
 
-        folders: List[Dict[str, Any]] = []
-        if not response:
-            return folders
+        while pending:
+            parent_id, parent_name, depth = pending.popleft()
+            url = self.client.format_graph_url(
+                "drives", drive_id, "items", parent_id, "children", query=_ITEM_QUERY
+            )
+            response = self.client.make_graph_request(url)
+            if not response:
+                continue
 
-        for item in response.get("value", []):
-            if "folder" in item:
-                folder_name = item["name"]
-                folder_id = item["id"]
-                folder_path = item["parentReference"]["path"] + f"/{folder_name}"
+            subfolder_count = 0
+            for item in self._iter_values(response):
+                if "folder" in item:
+                    folder_name = item["name"]
+                    folder_id = item["id"]
+                    folder_path = item["parentReference"]["path"] + f"/{folder_name}"
 
-                logger.info(f"Processing folder: {folder_name} at level {level}")
-                folders.append(
-                    {"name": folder_name, "id": folder_id, "path": folder_path}
-                )
+                    logger.info(f"Processing folder: {folder_name} at level {depth}")
+                    folders.append(
+                        {"name": folder_name, "id": folder_id, "path": folder_path}
+                    )
+                    pending.append((folder_id, folder_name, depth + 1))
+                    subfolder_count += 1
 
-                subfolders = self.list_all_folders(drive_id, folder_id, level + 1)
-                folders.extend(subfolders)
-                if subfolders:
-                    logger.info(f"Found {len(subfolders)} subfolders in {folder_name}")
+            if parent_name and subfolder_count:
+                logger.info(f"Found {subfolder_count} subfolders in {parent_name}")
 
         return folders
 
@@ -277,14 +387,16 @@ class ReadClient:
         if not self.client.access_token:
             return None
 
-        url = self.client.format_graph_url("drives", drive_id, "root/children")
+        url = self.client.format_graph_url(
+            "drives", drive_id, "root/children", query=_ITEM_QUERY
+        )
         response = self.client.make_graph_request(url)
 
         if not response:
             return None
 
         parent_folders = []
-        for item in response.get("value", []):
+        for item in self._iter_values(response):
             if "folder" in item:
                 folder_name = item["name"]
                 folder_path = item["parentReference"]["path"] + f"/{folder_name}"
@@ -308,15 +420,23 @@ class ReadClient:
         """
         if not self.client.access_token:
             return None
-        url = self.client.format_graph_url("drives", drive_id, "root/children")
+
+        cache_key = ("folder", drive_id, folder_name)
+        cached_id = self._get_cached_id(cache_key)
+        if cached_id:
+            return cached_id
+
+        url = self.client.format_graph_url(
+            "drives", drive_id, "root/children", query=_ITEM_QUERY
+        )
         response = self.client.make_graph_request(url)
         if response and "value" in response:
-            for item in response["value"]:
+            for item in self._iter_values(response):
                 if item.get("name") == folder_name:
-                    folder_id = item.get("id")
-                    if isinstance(folder_id, str):
-                        logger.info(f"Found folder: {folder_name}, ID: {folder_id}")
-                        return folder_id
+                    folder_id = cast(str, item["id"])
+                    logger.info(f"Found folder: {folder_name}, ID: {folder_id}")
+                    self._cache_id(cache_key, folder_id)
+                    return folder_id
 
         return None
 
@@ -336,26 +456,30 @@ class ReadClient:
             return None
 
         url = self.client.format_graph_url(
-            "drives", drive_id, "items", folder_id, "children"
+            "drives", drive_id, "items", folder_id, "children", query=_ITEM_QUERY
         )
         response = self.client.make_graph_request(url)
 
         if not response:
             return None
 
+        # Classify and count in the same pass instead of rescanning the result
         folder_contents: List[Dict[str, Any]] = []
-        for item in response.get("value", []):
-            folder_contents.append(
+        append = folder_contents.append
+        folders = 0
+        for item in self._iter_values(response):
+            is_folder = "folder" in item
+            folders += is_folder
+            append(
                 {
                     "id": item["id"],
                     "name": item["name"],
-                    "type": "folder" if "folder" in item else "file",
+                    "type": "folder" if is_folder else "file",
                     "webUrl": item.get("webUrl"),
                     "size": item.get("size", "N/A"),
                 }
             )
 
-        folders = sum(1 for item in folder_contents if item["type"] == "folder")
         files = len(folder_contents) - folders
         logger.info(f"Found {folders} folders and {files} files")
 
@@ -383,22 +507,30 @@ class ReadClient:
 
         for folder_name in folder_names:
             url = self.client.format_graph_url(
-                "drives", drive_id, "items", current_parent_id, "children"
+                "drives",
+                drive_id,
+                "items",
+                current_parent_id,
+                "children",
+                query=_ITEM_QUERY,
             )
             response = self.client.make_graph_request(url)
 
             if not response:
                 return None
 
-            folders = [
-                item
-                for item in response.get("value", [])
-                if item["name"] == folder_name and "folder" in item
-            ]
+            match = next(
+                (
+                    item
+                    for item in self._iter_values(response)
+                    if item["name"] == folder_name and "folder" in item
+                ),
+                None,
+            )
 
-            if folders:
-                current_parent_id = folders[0]["id"]
-                deepest_folder_name = folders[0]["name"]
+            if match:
+                current_parent_id = match["id"]
+                deepest_folder_name = match["name"]
                 logger.info(f"Processing folder: {folder_name}")
             else:
                 logger.info(f"Folder not found: {folder_name}")
@@ -423,22 +555,25 @@ class ReadClient:
 
         Returns:
             True if the file exists, False otherwise.
+
+        Raises:
+            requests.exceptions.HTTPError: For error responses other than 404.
         """
         if not self.client.access_token:
             return False
 
+        # Address the item by name under the folder so Graph does the lookup
         url = self.client.format_graph_url(
-            "drives", drive_id, "items", folder_id, "children"
+            f"drives/{drive_id}/items/{folder_id}:",
+            file_name,
+            query={"$select": "id,file"},
         )
-        response = self.client.make_graph_request(url)
+        # A miss is an ordinary answer here, so a 404 must not log an error
+        response = self.client.make_graph_request(url, allowed_statuses=(404,))
 
-        if not response:
-            return False
-
-        for item in response.get("value", []):
-            if item.get("name") == file_name and "file" in item:
-                logger.info(f"Found file: {file_name}")
-                return True
+        if response and "file" in response:
+            logger.info(f"Found file: {file_name}")
+            return True
 
         logger.info(f"File not found: {file_name}")
         return False
@@ -448,6 +583,8 @@ class ReadClient:
     ) -> Optional[bytes]:
         """Download a file from SharePoint
 
+        The whole file is buffered in memory; use download_file_to for large files.
+
         Args:
             file_path: Path to the file in SharePoint
             site_name: Optional name of the SharePoint site
@@ -456,9 +593,221 @@ class ReadClient:
         Returns:
             File content as bytes if successful, None otherwise
         """
-        if not self.client.access_token:
+        buffer = BytesIO()
+        if not self.download_file_to(file_path, site_name, drive_name, buffer):
             return None
+        return buffer.getvalue()
+
+    def download_file_to(
+        self,
+        file_path: str,
+        site_name: str,
+        drive_name: Optional[str],
+        dest: BinaryIO,
+        chunk_size: int = 1 << 20,
+    ) -> bool:
+        """Stream a file from SharePoint into a binary file object.
+
+        Args:
+            file_path: Path to the file in SharePoint
+            site_name: Name of the SharePoint site
+            drive_name: Name of the drive containing the file
+            dest: Writable binary file object receiving the content
+            chunk_size: Number of bytes read from the network per write
+
+        Returns:
+            True if the file was downloaded, False otherwise
+        """
+        if not self.client.access_token:
+            return False
+
+        download_url = self._get_download_url(file_path, site_name, drive_name)
+        if not download_url:
+            return False
+
+        return self._stream_to(download_url, file_path, dest, chunk_size)
+
+    def download_large_file(
+        self,
+        file_path: str,
+        site_name: str,
+        drive_name: Optional[str],
+        dest_path: str,
+        part_size: int = _PART_SIZE,
+        max_workers: int = _MAX_WORKERS,
+    ) -> bool:
+        """Download a large file to disk using concurrent HTTP Range requests.
+
+        Falls back to a single streamed request when the server does not
+        advertise byte ranges or the file fits in one part. The file is only
+        moved to dest_path once every part has arrived.
+
+        Args:
+            file_path: Path to the file in SharePoint
+            site_name: Name of the SharePoint site
+            drive_name: Name of the drive containing the file
+            dest_path: Local path the file is written to
+            part_size: Number of bytes fetched by each ranged request
+            max_workers: Maximum number of concurrent ranged requests, capped at
+                the session's connection pool size
+
+        Returns:
+            True if the file was downloaded, False otherwise
+        """
+        if not self.client.access_token:
+            return False
+
+        download_url = self._get_download_url(file_path, site_name, drive_name)
+        if not download_url:
+            return False
+
+        # Written beside the destination and moved into place only once the
+        # whole file has arrived, so a failed download leaves nothing behind
+        part_path = f"{dest_path}.part"
+        try:
+            downloaded = self._download_to_part(
+                download_url, file_path, part_path, part_size, max_workers
+            )
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Request failed: {str(e)}")
+            logger.info(f"Failed to download: {file_path}")
+            downloaded = False
+
+        if not downloaded:
+            with suppress(FileNotFoundError):
+                os.remove(part_path)
+            return False
+
+        os.replace(part_path, dest_path)
+        return True
 
+    def _download_to_part(
+        self,
+        download_url: str,
+        file_path: str,
+        part_path: str,
+        part_size: int,
+        max_workers: int,
+    ) -> bool:
+        """Fetch a content URL into part_path, by ranges when the server allows."""
+        head_response: Response = self.client.session.head(
+            download_url, allow_redirects=True
+        )
+        size = int(head_response.headers.get("Content-Length", 0))
+        accepts_ranges = head_response.headers.get("Accept-Ranges") == "bytes"
+
+        if head_response.status_code != 200 or not accepts_ranges or size <= part_size:
+            with open(part_path, "wb") as dest:
+                return self._stream_to(download_url, file_path, dest)
+
+        ranges = [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+        logger.info(f"Downloading {file_path} in {len(ranges)} parts")
+
+        # Pre-size the file so each worker can write its part at its own offset
+        with open(part_path, "wb") as dest:
+            dest.truncate(size)
+
+        workers = min(max_workers, len(ranges), _POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda part: self._download_range(
+                        download_url, part_path, part[0], part[1]
+                    ),
+                    ranges,
+                )
+            )
+
+        if not all(results):
+            logger.info(f"Failed to download: {file_path}")
+            return False
+
+        logger.info(f"Successfully downloaded: {file_path}")
+        return True
+
+    def _stream_to(
+        self,
+        download_url: str,
+        file_path: str,
+        dest: BinaryIO,
+        chunk_size: int = 1 << 20,
+    ) -> bool:
+        """Stream a content URL into a binary file object."""
+        download_response: Response = self.client.session.get(download_url, stream=True)
+        try:
+            if download_response.status_code == 404:
+                logger.info(f"File not found: {file_path}")
+                return False
+
+            if download_response.status_code != 200:
+                logger.info(f"Failed to download: {file_path}")
+                return False
+
+            for chunk in download_response.iter_content(chunk_size=chunk_size):
+                dest.write(chunk)
+        finally:
+            download_response.close()
+
+        logger.info(f"Successfully downloaded: {file_path}")
+        return True
+
+    def _download_range(
+        self, download_url: str, dest_path: str, start: int, end: int
+    ) -> bool:
+        """Fetch one byte range of a content URL and write it at its offset."""
+        headers = {"Range": f"bytes={start}-{end}"}
+
+        # A dropped connection fails this range only; the caller reports it
+        try:
+            range_response: Response = self.client.session.get(
+                download_url, headers=headers, stream=True
+            )
+            try:
+                if range_response.status_code != 206:
+                    logger.debug(
+                        f"Range {start}-{end} failed: {range_response.status_code}"
+                    )
+                    return False
+
+                # A 206 for a different range would be written at the wrong offset
+                content_range = range_response.headers.get("Content-Range", "")
+                if not content_range.startswith(f"bytes {start}-{end}/"):
+                    logger.debug(
+                        f"Range {start}-{end} failed: Content-Range {content_range!r}"
+                    )
+                    return False
+
+                expected = end - start + 1
+                received = 0
+                with open(dest_path, "r+b") as dest:
+                    dest.seek(start)
+                    for chunk in range_response.iter_content(chunk_size=1 << 20):
+                        received += len(chunk)
+                        if received > expected:
+                            break
+                        dest.write(chunk)
+            finally:
+                range_response.close()
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Range {start}-{end} failed: {str(e)}")
+            return False
+
+        # A short or overlong body would leave the part corrupt
+        if received != expected:
+            logger.debug(
+                f"Range {start}-{end} failed: received {received} of {expected} bytes"
+            )
+            return False
+
+        return True
+
+    def _get_download_url(
+        self, file_path: str, site_name: str, drive_name: Optional[str]
+    ) -> Optional[str]:
+        """Resolve the path-addressed content URL of a file in a drive."""
         site_id = self.get_site_id(site_name=site_name)
         if not site_id:
             logger.info(f"Site not found: {site_name}")
@@ -469,34 +818,8 @@ class ReadClient:
             logger.info(f"Drive not found: {drive_name}")
             return None
 
-        url = self.client.format_graph_url("drives", drive_id, "root/children")
-        list_response = self.client.make_graph_request(url)
-
-        if not list_response:
-            return None
-
-        file_id = None
-        for item in list_response.get("value", []):
-            if item.get("name") == file_path:
-                file_id = item.get("id")
-                logger.info(f"Found file: {file_path}")
-                break
-
-        if not file_id:
-            logger.info(f"File not found: {file_path}")
-            return None
-
-        download_url = self.client.format_graph_url(
-            "drives", drive_id, "items", file_id, "content"
+        # Let Graph resolve the path so the content is fetched in one request
+        item_path = quote(file_path.strip("/"), safe="/")
+        return self.client.format_graph_url(
+            f"drives/{drive_id}/root:/{item_path}:", "content"
         )
-        headers = {
-            "Authorization": f"Bearer {self.client.access_token}",
-        }
-
-        download_response: Response = requests.get(download_url, headers=headers)
-        if download_response.status_code == 200:
-            logger.info(f"Successfully downloaded: {file_path}")
-            return download_response.content
-
-        logger.info(f"Failed to download: {file_path}")
-        return None
@@ -0,0 +1,98 @@
+import logging
+import pytest
+from typing import Generator, Optional
+from unittest.mock import Mock
+
+from sharepycrud.config import SharePointConfig
+
+# Built once at import; tests must not modify either config
+_TEST_CONFIG = SharePointConfig(
+    tenant_id="test-tenant",
+    client_id="test-client-id",
+    client_secret="test-client-secret",
+    sharepoint_url="https://test.sharepoint.com",
+)
+_FAKE_CLIENT_CONFIG = SharePointConfig(
+    tenant_id="mock-tenant-id",
+    client_id="mock-client-id",
+    client_secret="mock-client-secret",
+    sharepoint_url="https://mock.sharepoint.com",
+)
+
+
+def _sharepycrud_only(record: logging.LogRecord) -> bool:
+    return record.name.startswith("sharepycrud")
+
+
+@pytest.fixture(autouse=True)
+def _filter_caplog(
+    caplog: pytest.LogCaptureFixture,
+) -> Generator[None, None, None]:
+    """Keep only sharepycrud records in caplog, dropping third-party log traffic."""
+    caplog.handler.addFilter(_sharepycrud_only)
+    yield
+    caplog.handler.removeFilter(_sharepycrud_only)
+
+
+@pytest.fixture(scope="session")
+def mock_config() -> SharePointConfig:
+    """Shared, read-only SharePointConfig for tests that never modify it."""
+    return _TEST_CONFIG
+
+
+class FakeBaseClient:
+    """
+    Stand-in for BaseClient whose Graph helpers are plain Mocks.
+
+    Plain Mocks keep construction and reset cheap; in exchange they accept
+    any arguments, so test_fake_base_client_matches_interface checks that
+    every faked helper still exists on BaseClient.
+    """
+
+    def __init__(self) -> None:
+        self.access_token: Optional[str] = "mock_access_token"
+        self.config = _FAKE_CLIENT_CONFIG
+        self.session = Mock()
+        self.make_graph_request = Mock()
+        self.iter_graph_pages = Mock()
+        self.format_graph_url = Mock()
+        self.parse_folder_path = Mock()
+
+    def reset(self) -> None:
+        """Forget calls, return values and side effects, and restore the token."""
+        self.access_token = "mock_access_token"
+        for mock in (
+            self.session,
+            self.make_graph_request,
+            self.iter_graph_pages,
+            self.format_graph_url,
+            self.parse_folder_path,
+        ):
+            mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def shared_base_client() -> Generator[FakeBaseClient, None, None]:
+    """
+    Fake BaseClient built once per module.
+
+    Tests should request mock_base_client, which resets it after each test.
+    """
+    base_client = FakeBaseClient()
+    yield base_client
+    base_client.reset()
+
+
+@pytest.fixture
+def mock_base_client(
+    shared_base_client: FakeBaseClient,
+) -> Generator[FakeBaseClient, None, None]:
+    """Fake BaseClient shared by the ReadClient and CreateClient tests."""
+    yield shared_base_client
+    shared_base_client.reset()
+
+
+@pytest.fixture
+def mock_graph(mock_base_client: FakeBaseClient) -> Mock:
+    """The mocked make_graph_request; set return_value or side_effect per test."""
+    return mock_base_client.make_graph_request
@@ -1,376 +1,654 @@
-from unittest.mock import patch, MagicMock
+import copy
+from unittest.mock import patch, MagicMock, Mock
 import pytest
 import requests
+import responses
+from responses import matchers
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from sharepycrud.baseClient import BaseClient
 from sharepycrud.config import SharePointConfig
-from typing import Any, Dict, cast, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple, cast
 import logging
 
+_GRAPH_URL = "https://example.com/api"
 
-@pytest.fixture
-def mock_config() -> SharePointConfig:
-    """Fixture for a mock SharePointConfig."""
-    return SharePointConfig(
-        tenant_id="test-tenant",
-        client_id="test-client-id",
-        client_secret="test-client-secret",
-        sharepoint_url="https://test.sharepoint.com",
+_EXPECTED_TOKEN_URL = "https://login.microsoftonline.com/test-tenant/oauth2/v2.0/token"
+_EXPECTED_TOKEN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+_EXPECTED_TOKEN_DATA = {
+    "grant_type": "client_credentials",
+    "client_id": "test-client-id",
+    "client_secret": "test-client-secret",
+    "scope": "https://graph.microsoft.com/.default",
+}
+_EXPECTED_AUTH_HEADER = "Bearer mock_access_token"
+
+
+@pytest.fixture(scope="session")
+def base_client(mock_config: SharePointConfig) -> BaseClient:
+    """
+    Shared BaseClient with a mock access token.
+
+    Built without running __init__, so no token request is patched or made.
+    Tests that change client state should work on detached_copy(base_client).
+    """
+    client = BaseClient.__new__(BaseClient)
+    client.config = mock_config
+    client.session = BaseClient._create_session()
+    client.access_token = "mock_access_token"
+    return client
+
+
+@pytest.fixture(scope="module", autouse=True)
+def http_transport() -> Generator[responses.RequestsMock, None, None]:
+    """
+    Serve Graph and token requests from one responses registry per module.
+
+    Unregistered URLs raise ConnectionError, so no test reaches the network.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture(autouse=True)
+def _reset_http_transport(http_transport: responses.RequestsMock) -> None:
+    """Give each test clean call records and registrations."""
+    http_transport.reset()
+
+
+@pytest.fixture(autouse=True)
+def _debug_logs(caplog: Any) -> None:
+    """Capture sharepycrud debug logs in every test."""
+    caplog.set_level(logging.DEBUG, logger="sharepycrud")
+
+
+def _logged(caplog: Any, message: str) -> bool:
+    """Whether a record with exactly this message was captured."""
+    return any(record.getMessage() == message for record in caplog.records)
+
+
+def _logged_with_detail(caplog: Any, prefix: str) -> bool:
+    """Whether a record starts with prefix and carries a non-empty detail after it."""
+    return any(
+        record.getMessage().startswith(prefix) and record.getMessage() != prefix
+        for record in caplog.records
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_token_cache() -> None:
+    """Start every test without cached access tokens."""
+    BaseClient.clear_token_cache()
+
+
 @pytest.fixture
-def base_client(mock_config: SharePointConfig) -> BaseClient:
-    """Fixture for BaseClient with a mocked access token."""
-    with patch.object(
-        BaseClient, "_get_access_token", return_value="mock_access_token"
-    ):
-        return BaseClient(mock_config)
+def graph_endpoint(
+    http_transport: responses.RequestsMock,
+) -> responses.RequestsMock:
+    """Registry for Graph calls; register responses for _GRAPH_URL per test."""
+    return http_transport
+
+
+@pytest.fixture
+def token_endpoint(
+    http_transport: responses.RequestsMock,
+) -> responses.RequestsMock:
+    """Registry for the token endpoint; add responses with token_endpoint.add."""
+    return http_transport
+
 
+def _calls_to(rsps: responses.RequestsMock, url: str) -> List[responses.Call]:
+    """Calls the shared registry served for one URL."""
+    return [call for call in rsps.calls if call.request.url == url]
 
-def test_init_no_access_token(caplog: Any) -> None:
+
+def _add_token(token_endpoint: responses.RequestsMock, **kwargs: Any) -> None:
+    """Register one response for the Azure AD token URL."""
+    token_endpoint.add(responses.POST, _EXPECTED_TOKEN_URL, **kwargs)
+
+
+@pytest.fixture
+def mock_sleep() -> Generator[MagicMock, None, None]:
+    """Patch the retry sleep so throttling tests run instantly."""
+    with patch("sharepycrud.baseClient.time.sleep") as mock:
+        yield mock
+
+
+def detached_copy(client: BaseClient) -> BaseClient:
+    """Copy a client with its own session so state changes don't leak."""
+    clone = copy.copy(client)
+    clone.session = BaseClient._create_session()
+    clone.access_token = client.access_token
+    return clone
+
+
+def test_fake_base_client_matches_interface(mock_base_client: Any) -> None:
+    """Test that every attribute the client tests fake exists on BaseClient."""
+    delegated = [
+        name
+        for name, value in vars(mock_base_client).items()
+        if isinstance(value, Mock) and name != "session"
+    ]
+    assert delegated, "FakeBaseClient fakes no BaseClient methods"
+    for name in delegated:
+        assert callable(getattr(BaseClient, name)), name
+    assert isinstance(BaseClient.access_token, property)
+
+
+def test_init_no_access_token(mock_config: SharePointConfig, caplog: Any) -> None:
     """
     Test that BaseClient.__init__ raises a ValueError if no access token is obtained.
     This covers the lines that log an error and raise ValueError.
     """
-    config: SharePointConfig = SharePointConfig(
-        tenant_id="test-tenant",
-        client_id="test-client-id",
-        client_secret="test-client-secret",
-        sharepoint_url="https://test.sharepoint.com",
-    )
-
     # Patch _get_access_token to return None, triggering the failure path
     with patch.object(BaseClient, "_get_access_token", return_value=None):
         with pytest.raises(ValueError, match="Failed to obtain access token"):
-            BaseClient(config)
+            BaseClient(mock_config)
 
-    assert "Failed to obtain access token during initialization" in caplog.text
+    assert _logged(caplog, "Failed to obtain access token during initialization")
 
 
-def test_get_access_token_success(mock_config: SharePointConfig, caplog: Any) -> None:
+def test_get_access_token_success(
+    base_client: BaseClient, caplog: Any, token_endpoint: responses.RequestsMock
+) -> None:
     """
     Test that _get_access_token returns a valid token.
     """
-    caplog.set_level(logging.DEBUG, logger="sharepycrud")
-
-    # 1) Patch _get_access_token for __init__ so it won't fail immediately
-    with patch.object(
-        BaseClient, "_get_access_token", return_value="constructor_mock_token"
-    ):
-        client: BaseClient = BaseClient(mock_config)
-
-    # 2) Now use the *real* _get_access_token to test success scenario
-    with patch("requests.post") as mock_post:
-        mock_response: MagicMock = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"access_token": "test_access_token"}
-        mock_post.return_value = mock_response
+    # Use the *real* _get_access_token on the shared client
+    _add_token(
+        token_endpoint,
+        json={"access_token": "test_access_token"},
+        match=[
+            matchers.header_matcher(_EXPECTED_TOKEN_HEADERS),
+            matchers.urlencoded_params_matcher(_EXPECTED_TOKEN_DATA),
+        ],
+    )
 
-        token: Optional[str] = client._get_access_token()
-        assert token == "test_access_token"
-    assert "Successfully obtained access token" in caplog.text
+    token: Optional[str] = base_client._get_access_token()
+    assert token == "test_access_token"
+    assert len(token_endpoint.calls) == 1
+    # The shared session's bearer token must not be sent to the token endpoint
+    assert "Authorization" not in token_endpoint.calls[0].request.headers
+    assert _logged(caplog, "Successfully obtained access token")
 
 
-def test_get_access_token_missing_token(
-    mock_config: SharePointConfig, caplog: Any
+def test_get_access_token_uses_cache(
+    mock_config: SharePointConfig, token_endpoint: responses.RequestsMock
 ) -> None:
     """
-    Test that _get_access_token raises a ValueError if the response is JSON but missing 'access_token'.
+    Test that a second BaseClient for the same tenant and client reuses the cached token.
     """
-    # 1) Patch _get_access_token for __init__ so it won't fail
-    with patch.object(
-        BaseClient, "_get_access_token", return_value="constructor_mock_token"
-    ):
-        client: BaseClient = BaseClient(mock_config)
-
-    # 2) Now patch requests.post to return a token-less JSON response
-    with patch("requests.post") as mock_post:
-        mock_response: MagicMock = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"not_access_token": "some_value"}
-        mock_post.return_value = mock_response
+    _add_token(
+        token_endpoint, json={"access_token": "cached_token", "expires_in": 3600}
+    )
 
-        with pytest.raises(ValueError, match="Failed to obtain access token"):
-            client._get_access_token()
+    first = BaseClient(mock_config)
+    second = BaseClient(mock_config)
 
-    assert "No access token in response" in caplog.text
+    assert first.access_token == second.access_token == "cached_token"
+    assert len(token_endpoint.calls) == 1
 
 
-def test_get_access_token_http_error(
-    mock_config: SharePointConfig, caplog: Any
+def test_get_access_token_refreshes_on_expiry(
+    mock_config: SharePointConfig,
+    token_endpoint: responses.RequestsMock,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """
-    Test that _get_access_token raises a ValueError if an HTTPError occurs.
+    Test that a cached token is replaced once it is within the expiry margin.
     """
-    caplog.set_level(logging.DEBUG, logger="sharepycrud")
-
-    # 1) Patch _get_access_token for __init__ so it won't fail
-    with patch.object(
-        BaseClient, "_get_access_token", return_value="constructor_mock_token"
-    ):
-        client: BaseClient = BaseClient(mock_config)
-
-    # Mock an HTTPError
-    with patch("requests.post") as mock_post:
-        mock_response: MagicMock = MagicMock()
-        http_error: requests.exceptions.HTTPError = requests.exceptions.HTTPError(
-            "Mock HTTP error"
-        )
-        http_error.response = MagicMock()
-        http_error.response.status_code = 400
-        http_error.response.reason = "Bad Request"
-        http_error.response.text = "Error details"
-        mock_response.raise_for_status.side_effect = http_error
-        mock_post.return_value = mock_response
+    now = 1000.0
+    monkeypatch.setattr("sharepycrud.baseClient.time.monotonic", lambda: now)
+    # Registered responses for the same URL are served in order
+    _add_token(token_endpoint, json={"access_token": "old_token", "expires_in": 3600})
+    _add_token(token_endpoint, json={"access_token": "new_token", "expires_in": 3600})
+
+    assert BaseClient(mock_config).access_token == "old_token"
+
+    now += 3600 - 60
+    assert BaseClient(mock_config).access_token == "new_token"
+    assert len(token_endpoint.calls) == 2
+
+
+@pytest.mark.parametrize(
+    "token_response, expected_logs",
+    [
+        (
+            {"json": {"not_access_token": "some_value"}},
+            ["No access token in response"],
+        ),
+        (
+            {"status": 400, "body": "Error details"},
+            [
+                "HTTP error getting access token: 400 - Bad Request",
+                "Response content: Error details",
+            ],
+        ),
+        (
+            {"body": requests.exceptions.RequestException("Network failure")},
+            ["Failed to get access token: Network failure"],
+        ),
+    ],
+    ids=["missing_token", "http_error", "request_exception"],
+)
+def test_get_access_token_failure(
+    base_client: BaseClient,
+    caplog: Any,
+    token_endpoint: responses.RequestsMock,
+    token_response: Dict[str, Any],
+    expected_logs: List[str],
+) -> None:
+    """
+    Test that _get_access_token raises a ValueError and logs why for each failure mode.
+    """
+    _add_token(token_endpoint, **token_response)
 
-        with pytest.raises(ValueError, match="Failed to obtain access token"):
-            client._get_access_token()
+    with pytest.raises(ValueError, match="Failed to obtain access token"):
+        base_client._get_access_token()
 
-    assert "HTTP error getting access token: 400 - Bad Request" in caplog.text
-    assert "Response content: Error details" in caplog.text
+    for expected_log in expected_logs:
+        assert _logged(caplog, expected_log)
 
 
-def test_get_access_token_request_exception(
-    mock_config: SharePointConfig, caplog: Any
+def test_get_access_token_malformed_json(
+    base_client: BaseClient, caplog: Any, token_endpoint: responses.RequestsMock
 ) -> None:
     """
-    Test that _get_access_token raises a ValueError if a generic requests.exceptions.RequestException occurs.
+    Test that an invalid JSON token response fails with requests' JSONDecodeError as the cause.
     """
-    # 1) Patch _get_access_token for __init__ so it won't fail
-    with patch.object(
-        BaseClient, "_get_access_token", return_value="constructor_mock_token"
-    ):
-        client: BaseClient = BaseClient(mock_config)
+    _add_token(token_endpoint, body="<html>", content_type="application/json")
 
-    # 2) Simulate a generic RequestException (e.g., network failure)
-    with patch("requests.post") as mock_post:
-        mock_post.side_effect = requests.exceptions.RequestException("Network failure")
+    with pytest.raises(ValueError, match="Failed to obtain access token") as excinfo:
+        base_client._get_access_token()
 
-        with pytest.raises(ValueError, match="Failed to obtain access token"):
-            client._get_access_token()
+    assert isinstance(excinfo.value.__context__, requests.exceptions.JSONDecodeError)
+    assert _logged_with_detail(caplog, "Failed to get access token: ")
 
-    assert "Failed to get access token: Network failure" in caplog.text
 
-
-def test_make_graph_request_success(base_client: BaseClient) -> None:
+def test_make_graph_request_success(
+    base_client: BaseClient, graph_endpoint: responses.RequestsMock
+) -> None:
     """Test that make_graph_request returns the correct response."""
-    with patch("requests.request") as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            headers={"Content-Type": "application/json"},
-            json=lambda: {"key": "value"},
-        )
-        response: Dict[str, Any] = base_client.make_graph_request(
-            "https://mock-url.com"
-        )
-        assert response == {"key": "value"}
-
-
-def test_make_graph_request_error(base_client: BaseClient) -> None:
-    """Test that make_graph_request handles HTTP errors."""
-    with patch("requests.request") as mock_request:
-        mock_response: MagicMock = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "Mock HTTP error"
-        )
-        mock_response.status_code = 500
-        mock_response.text = "Error occurred"
-        mock_response.reason = "Internal Server Error"
-        mock_response.headers = {"Content-Type": "application/json"}
+    graph_endpoint.get(_GRAPH_URL, json={"key": "value"})
+    response: Dict[str, Any] = base_client.make_graph_request(_GRAPH_URL)
+    assert response == {"key": "value"}
 
-        mock_request.return_value = mock_response
 
-        with pytest.raises(requests.exceptions.HTTPError, match="Mock HTTP error"):
-            base_client.make_graph_request("https://mock-url.com")
+def test_make_graph_request_error(
+    base_client: BaseClient, graph_endpoint: responses.RequestsMock
+) -> None:
+    """Test that make_graph_request handles HTTP errors."""
+    graph_endpoint.get(
+        _GRAPH_URL,
+        status=500,
+        body="Error occurred",
+        content_type="application/json",
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError, match="500 Server Error"):
+        base_client.make_graph_request(_GRAPH_URL)
 
 
 def test_make_graph_request_no_access_token(
-    mock_config: SharePointConfig, caplog: Any
+    base_client: BaseClient, caplog: Any
 ) -> None:
     """
     Test that make_graph_request raises ValueError if the access token is missing/invalid.
-    We bypass the constructor check by returning a mock token, then set access_token = None.
+    The token is removed from a detached copy so the shared client is untouched.
     """
-    caplog.set_level(logging.DEBUG, logger="sharepycrud")
-
-    # 1) Patch _get_access_token for __init__ so it won't fail
-    with patch.object(
-        BaseClient, "_get_access_token", return_value="constructor_mock_token"
-    ):
-        client_no_token = BaseClient(mock_config)
-
-    # 2) Now manually remove the token to simulate "no access token"
+    client_no_token = detached_copy(base_client)
     client_no_token.access_token = None
     with pytest.raises(ValueError, match="Access token is missing or invalid"):
         client_no_token.make_graph_request("https://example.com")
 
-    assert "Access token is missing or invalid" in caplog.text
+    assert _logged(caplog, "Access token is missing or invalid")
 
 
-def test_make_graph_request_with_custom_headers(base_client: BaseClient) -> None:
+def test_make_graph_request_refreshes_token_on_401(
+    base_client: BaseClient,
+    graph_endpoint: responses.RequestsMock,
+    token_endpoint: responses.RequestsMock,
+) -> None:
+    """
+    Test that a 401 triggers one token refresh and the request is retried.
+    """
+    client = detached_copy(base_client)
+    # Registered responses for the same URL are served in order
+    graph_endpoint.get(_GRAPH_URL, status=401)
+    graph_endpoint.get(_GRAPH_URL, json={"key": "value"})
+    _add_token(token_endpoint, json={"access_token": "fresh_token"})
+
+    response = client.make_graph_request(_GRAPH_URL)
+
+    assert response == {"key": "value"}
+    assert client.session.headers["Authorization"] == "Bearer fresh_token"
+    graph_calls = _calls_to(graph_endpoint, _GRAPH_URL)
+    assert len(graph_calls) == 2
+    assert graph_calls[1].request.headers["Authorization"] == "Bearer fresh_token"
+    assert len(_calls_to(token_endpoint, _EXPECTED_TOKEN_URL)) == 1
+
+
+def test_make_graph_request_refreshes_token_only_once(
+    base_client: BaseClient,
+    graph_endpoint: responses.RequestsMock,
+    token_endpoint: responses.RequestsMock,
+) -> None:
+    """
+    Test that a second 401 after refreshing is raised instead of looping.
+    """
+    client = detached_copy(base_client)
+    graph_endpoint.get(_GRAPH_URL, status=401)
+    _add_token(token_endpoint, json={"access_token": "fresh_token"})
+
+    with pytest.raises(requests.exceptions.HTTPError, match="401"):
+        client.make_graph_request(_GRAPH_URL)
+
+    graph_calls = _calls_to(graph_endpoint, _GRAPH_URL)
+    assert len(graph_calls) == 2
+    assert len(_calls_to(token_endpoint, _EXPECTED_TOKEN_URL)) == 1
+
+
+def test_make_graph_request_with_custom_headers(
+    base_client: BaseClient, graph_endpoint: responses.RequestsMock
+) -> None:
     """
     Test that make_graph_request correctly merges custom headers with default headers.
     """
-    with patch("requests.request") as mock_request:
-        mock_response: MagicMock = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.json.return_value = {"result": "ok"}
-        mock_request.return_value = mock_response
+    graph_endpoint.post(_GRAPH_URL, json={"result": "ok"})
+
+    custom_headers: Dict[str, str] = {"X-Custom-Header": "12345"}
+    response: Dict[str, Any] = base_client.make_graph_request(
+        url=_GRAPH_URL,
+        method="POST",
+        headers=custom_headers,
+    )
+
+    assert response == {"result": "ok"}
+
+    request = graph_endpoint.calls[0].request
+    assert request.method == "POST"
+    assert request.url == _GRAPH_URL
+    # Custom headers are sent per call alongside the session's auth header
+    assert request.headers["X-Custom-Header"] == "12345"
+    assert request.headers["Accept"] == "application/json"
+    assert request.headers["Authorization"] == _EXPECTED_AUTH_HEADER
+    assert "X-Custom-Header" not in base_client.session.headers
+
+
+def test_access_token_updates_session_headers(base_client: BaseClient) -> None:
+    """
+    Test that setting access_token refreshes or clears the session Authorization header.
+    """
+    client = detached_copy(base_client)
 
-        custom_headers: Dict[str, str] = {"X-Custom-Header": "12345"}
-        response: Dict[str, Any] = base_client.make_graph_request(
-            url="https://example.com/api",
-            method="POST",
-            headers=custom_headers,
-        )
+    client.access_token = "refreshed_token"
+    assert client.session.headers["Authorization"] == "Bearer refreshed_token"
 
-        assert response == {"result": "ok"}
+    client.access_token = None
+    assert "Authorization" not in client.session.headers
+    assert base_client.session.headers["Authorization"] == _EXPECTED_AUTH_HEADER
 
-        call_args: tuple[str, str] = mock_request.call_args.args  # Positional arguments
-        call_kwargs: Dict[str, Any] = mock_request.call_args.kwargs  # Keyword arguments
 
-        # Check HTTP method (first positional argument)
-        assert call_args[0] == "POST"
-        # Check URL (second positional argument)
-        assert call_args[1] == "https://example.com/api"
-        # Check headers (in kwargs)
-        sent_headers: Dict[str, str] = call_kwargs["headers"]
-        assert sent_headers["Authorization"] == "Bearer mock_access_token"
-        assert sent_headers["X-Custom-Header"] == "12345"
+def test_session_does_not_default_to_json_accept(base_client: BaseClient) -> None:
+    """Test that downloads through the session are not sent Accept: application/json."""
+    assert base_client.session.headers["Accept"] == "*/*"
 
 
 def test_make_graph_request_returns_empty_dict_for_non_json(
     base_client: BaseClient,
+    graph_endpoint: responses.RequestsMock,
 ) -> None:
     """
     Test that make_graph_request returns an empty dict for a non-JSON response.
     """
-    with patch("requests.request") as mock_request:
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.headers = {"Content-Type": "text/plain"}  # Not JSON
-        mock_request.return_value = mock_response
+    graph_endpoint.get(_GRAPH_URL, body="", content_type="text/plain")  # Not JSON
 
-        result: Dict[str, Any] = base_client.make_graph_request(
-            "https://example.com/api"
-        )
-        assert result == {}, "Expected an empty dict for non-JSON response"
+    result: Dict[str, Any] = base_client.make_graph_request(_GRAPH_URL)
+    assert result == {}, "Expected an empty dict for non-JSON response"
 
 
-def test_make_graph_request_http_error_with_response(
-    base_client: BaseClient, caplog: Any
+def test_session_mounts_transport_retry(base_client: BaseClient) -> None:
+    """Test that the shared session retries transport errors at the adapter."""
+    adapter = cast(
+        HTTPAdapter, base_client.session.get_adapter("https://graph.microsoft.com")
+    )
+    assert adapter.max_retries.total == 5
+    assert 429 not in (adapter.max_retries.status_forcelist or ())
+    assert not adapter.max_retries.is_retry("GET", 429, has_retry_after=True)
+
+
+def test_session_pool_exceeds_requests_default(base_client: BaseClient) -> None:
+    """Test that the connection pool is sized above requests' default of 10."""
+    adapter = cast(
+        HTTPAdapter, base_client.session.get_adapter("https://graph.microsoft.com")
+    )
+    pool_maxsize = adapter.poolmanager.connection_pool_kw["maxsize"]
+    assert pool_maxsize > DEFAULT_POOLSIZE
+
+
+def test_make_graph_request_retries_throttled_with_retry_after(
+    base_client: BaseClient,
+    caplog: Any,
+    graph_endpoint: responses.RequestsMock,
+    mock_sleep: MagicMock,
 ) -> None:
-    """
-    Test that make_graph_request handles HTTP errors and logs the error details.
-    """
-    caplog.set_level(logging.DEBUG, logger="sharepycrud")
+    """Test that a 429 is retried after the delay given in Retry-After."""
+    graph_endpoint.get(_GRAPH_URL, status=429, headers={"Retry-After": "2"})
+    graph_endpoint.get(_GRAPH_URL, json={"key": "value"})
 
-    with patch("requests.request") as mock_request:
-        mock_response = MagicMock()
-        http_error = requests.exceptions.HTTPError("Mock HTTP error")
-        http_error.response = MagicMock()
-        http_error.response.status_code = 500
-        http_error.response.reason = "Server Error"
-        http_error.response.text = "Internal Server Error"
+    response = base_client.make_graph_request(_GRAPH_URL)
 
-        mock_response.raise_for_status.side_effect = http_error
-        mock_request.return_value = mock_response
+    assert response == {"key": "value"}
+    assert len(_calls_to(graph_endpoint, _GRAPH_URL)) == 2
+    mock_sleep.assert_called_once_with(2.0)
+    assert _logged(caplog, "Request throttled (429), retrying in 2.0s")
 
-        with pytest.raises(requests.exceptions.HTTPError, match="Mock HTTP error"):
-            base_client.make_graph_request("https://example.com/api")
 
-    assert "HTTP error in request: 500 - Server Error" in caplog.text
-    assert "Response content: Internal Server Error" in caplog.text
-    assert "Failed URL: https://example.com/api" in caplog.text
+def test_make_graph_request_backs_off_without_retry_after(
+    base_client: BaseClient,
+    graph_endpoint: responses.RequestsMock,
+    mock_sleep: MagicMock,
+) -> None:
+    """Test that a 503 without Retry-After uses capped exponential backoff."""
+    graph_endpoint.get(_GRAPH_URL, status=503)
+    graph_endpoint.get(_GRAPH_URL, status=503)
+    graph_endpoint.get(_GRAPH_URL)
 
+    with patch("sharepycrud.baseClient.random.uniform", return_value=1.0):
+        base_client.make_graph_request(_GRAPH_URL)
 
-def test_make_graph_request_request_exception(
-    base_client: BaseClient, caplog: Any
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+
+def test_make_graph_request_gives_up_after_max_attempts(
+    base_client: BaseClient,
+    graph_endpoint: responses.RequestsMock,
+    mock_sleep: MagicMock,
 ) -> None:
+    """Test that throttling is raised once every attempt has been used."""
+    graph_endpoint.get(_GRAPH_URL, status=429, headers={"Retry-After": "0"})
+
+    with pytest.raises(requests.exceptions.HTTPError, match="429"):
+        base_client.make_graph_request(_GRAPH_URL)
+
+    assert len(_calls_to(graph_endpoint, _GRAPH_URL)) == 5
+    assert mock_sleep.call_count == 4
+
+
+def test_iter_graph_pages_follows_next_link(base_client: BaseClient) -> None:
     """
-    Test that make_graph_request raises a requests.exceptions.RequestException if a generic requests exception occurs.
+    Test that iter_graph_pages yields items from every page until nextLink is absent.
     """
-    caplog.set_level(logging.DEBUG, logger="sharepycrud")
+    pages = [
+        {"value": [{"id": "1"}, {"id": "2"}], "@odata.nextLink": "https://next"},
+        {"value": [{"id": "3"}]},
+    ]
+    with patch.object(
+        base_client, "make_graph_request", side_effect=pages
+    ) as mock_graph_request:
+        items = list(base_client.iter_graph_pages("https://first"))
 
-    with patch(
-        "requests.request",
-        side_effect=requests.exceptions.RequestException("Network Error"),
-    ):
-        with pytest.raises(requests.exceptions.RequestException, match="Network Error"):
-            base_client.make_graph_request("https://example.com/api")
+    assert [item["id"] for item in items] == ["1", "2", "3"]
+    assert [c.args[0] for c in mock_graph_request.call_args_list] == [
+        "https://first",
+        "https://next",
+    ]
 
-    assert "Request failed: Network Error" in caplog.text
-    assert "Failed URL: https://example.com/api" in caplog.text
 
+def test_iter_graph_pages_is_lazy(base_client: BaseClient) -> None:
+    """
+    Test that iter_graph_pages does not fetch the next page until it is needed.
+    """
+    pages = [{"value": [{"id": "1"}], "@odata.nextLink": "https://next"}]
+    with patch.object(
+        base_client, "make_graph_request", side_effect=pages
+    ) as mock_graph_request:
+        first = next(base_client.iter_graph_pages("https://first"))
 
-def test_format_graph_url(base_client: BaseClient) -> None:
-    """Test that format_graph_url correctly formats URLs."""
-    url: str = base_client.format_graph_url("sites", "site-id", "lists")
-    assert url == "https://graph.microsoft.com/v1.0/sites/site-id/lists"
+    assert first == {"id": "1"}
+    mock_graph_request.assert_called_once_with("https://first")
 
 
-def test_format_graph_url_no_args(base_client: BaseClient, caplog: Any) -> None:
+def test_make_graph_request_http_error_with_response(
+    base_client: BaseClient,
+    caplog: Any,
+    graph_endpoint: responses.RequestsMock,
+) -> None:
     """
-    Test that format_graph_url correctly formats URLs with no additional arguments.
+    Test that make_graph_request handles HTTP errors and logs the error details.
     """
-    caplog.set_level(logging.DEBUG)
+    graph_endpoint.get(_GRAPH_URL, status=500, body="Internal Server Error")
 
-    base_path = "sites"
-    url: str = base_client.format_graph_url(base_path)
-    assert url == "https://graph.microsoft.com/v1.0/sites"
-    assert f"Formatted Graph API URL: {url}" in caplog.text
+    with pytest.raises(requests.exceptions.HTTPError, match="500 Server Error"):
+        base_client.make_graph_request(_GRAPH_URL)
+
+    assert _logged(caplog, "HTTP error in request: 500 - Internal Server Error")
+    assert _logged(caplog, "Response content: Internal Server Error")
+    assert _logged(caplog, f"Failed URL: {_GRAPH_URL}")
 
 
-def test_format_graph_url_exception(base_client: BaseClient, caplog: Any) -> None:
+def test_make_graph_request_allowed_status(
+    base_client: BaseClient, caplog: Any, graph_endpoint: responses.RequestsMock
+) -> None:
     """
-    Test that format_graph_url raises an exception if there's an error formatting the URL.
+    Test that an allowed error status returns None without raising or logging an error.
     """
-    caplog.set_level(logging.DEBUG)
+    graph_endpoint.get(_GRAPH_URL, status=404)
 
-    with patch(
-        "sharepycrud.baseClient.quote", side_effect=Exception("Mock Encoding Error")
-    ):
-        base_path = "sites"
-        args = ("invalid_path",)  # Note: args is a tuple when passed with *args
+    result = base_client.make_graph_request(_GRAPH_URL, allowed_statuses=(404,))
 
-        with pytest.raises(Exception, match="Mock Encoding Error"):
-            base_client.format_graph_url(base_path, *args)
+    assert result is None
+    assert not any(record.levelno >= logging.ERROR for record in caplog.records)
 
-    assert "Error formatting Graph API URL: Mock Encoding Error" in caplog.text
-    assert f"base_path: {base_path}, args: {args}" in caplog.text
 
+def test_make_graph_request_malformed_json(
+    base_client: BaseClient, caplog: Any, graph_endpoint: responses.RequestsMock
+) -> None:
+    """
+    Test that a JSON response with an invalid body raises requests' JSONDecodeError.
+    """
+    graph_endpoint.get(_GRAPH_URL, body="<html>", content_type="application/json")
 
-def test_parse_folder_path(base_client: BaseClient) -> None:
-    """Test that parse_folder_path correctly parses folder paths."""
-    result: list[str] = base_client.parse_folder_path("/Folder1/Folder2/Folder3/")
-    assert result == ["Folder1", "Folder2", "Folder3"]
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        base_client.make_graph_request(_GRAPH_URL)
 
+    assert _logged_with_detail(caplog, "Request failed: ")
+    assert _logged(caplog, f"Failed URL: {_GRAPH_URL}")
 
-def test_parse_folder_path_valid(base_client: BaseClient, caplog: Any) -> None:
+
+def test_make_graph_request_request_exception(
+    base_client: BaseClient, caplog: Any, graph_endpoint: responses.RequestsMock
+) -> None:
     """
-    Test parse_folder_path for a valid folder path to ensure parsing works.
+    Test that make_graph_request raises a requests.exceptions.RequestException if a generic requests exception occurs.
     """
-    caplog.set_level(logging.DEBUG)
+    graph_endpoint.get(
+        _GRAPH_URL, body=requests.exceptions.RequestException("Network Error")
+    )
 
-    folder_path = "/Folder1/FolderNest1/FolderNest2/"
-    components: list[str] = base_client.parse_folder_path(folder_path)
-    assert components == ["Folder1", "FolderNest1", "FolderNest2"]
-    assert f"Parsed folder path '{folder_path}' into: {components}" in caplog.text
+    with pytest.raises(requests.exceptions.RequestException, match="Network Error"):
+        base_client.make_graph_request(_GRAPH_URL)
+
+    assert _logged(caplog, "Request failed: Network Error")
+    assert _logged(caplog, f"Failed URL: {_GRAPH_URL}")
+
+
+@pytest.mark.parametrize(
+    "base_path, args, query, expected",
+    [
+        (
+            "sites",
+            ("site-id", "lists"),
+            None,
+            "https://graph.microsoft.com/v1.0/sites/site-id/lists",
+        ),
+        ("sites", (), None, "https://graph.microsoft.com/v1.0/sites"),
+        (
+            "drives",
+            ("drive id", "root/children"),
+            {"$select": "id,name", "$top": "999"},
+            "https://graph.microsoft.com/v1.0/drives/drive%20id/root%2Fchildren"
+            "?$select=id,name&$top=999",
+        ),
+    ],
+    ids=["with_args", "no_args", "with_query"],
+)
+def test_format_graph_url(
+    base_client: BaseClient,
+    caplog: Any,
+    base_path: str,
+    args: Tuple[str, ...],
+    query: Optional[Dict[str, str]],
+    expected: str,
+) -> None:
+    """Test that format_graph_url encodes path components and query parameters."""
+    url: str = base_client.format_graph_url(base_path, *args, query=query)
+    assert url == expected
+    assert _logged(caplog, f"Formatted Graph API URL: {url}")
 
 
-def test_parse_folder_path_empty_input(base_client: BaseClient) -> None:
-    """Test parse_folder_path with empty input."""
-    result = base_client.parse_folder_path("")
-    assert result == [""]
+def test_format_graph_url_exception(
+    base_client: BaseClient, caplog: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that format_graph_url raises an exception if there's an error formatting the URL.
+    """
+
+    def failing_quote(*args: Any, **kwargs: Any) -> str:
+        raise Exception("Mock Encoding Error")
+
+    monkeypatch.setattr("sharepycrud.baseClient._QUOTE", failing_quote)
+    base_path = "sites"
+    args = ("invalid_path",)  # Note: args is a tuple when passed with *args
+
+    with pytest.raises(Exception, match="Mock Encoding Error"):
+        base_client.format_graph_url(base_path, *args)
+
+    assert _logged(caplog, "Error formatting Graph API URL: Mock Encoding Error")
+    assert _logged(caplog, f"base_path: {base_path}, args: {args}")
+
+
+@pytest.mark.parametrize(
+    "folder_path, expected",
+    [
+        ("/Folder1/Folder2/Folder3/", ["Folder1", "Folder2", "Folder3"]),
+        ("Folder1/FolderNest1/FolderNest2", ["Folder1", "FolderNest1", "FolderNest2"]),
+        ("", [""]),
+    ],
+    ids=["slashes", "no_slashes", "empty"],
+)
+def test_parse_folder_path(
+    base_client: BaseClient, caplog: Any, folder_path: str, expected: List[str]
+) -> None:
+    """Test that parse_folder_path splits paths into their components."""
+    components: List[str] = base_client.parse_folder_path(folder_path)
+    assert components == expected
+    assert _logged(caplog, f"Parsed folder path '{folder_path}' into: {components}")
 
 
 def test_parse_folder_path_exception(base_client: BaseClient, caplog: Any) -> None:
     """
     Test that parse_folder_path raises an exception if the input is None.
     """
-    caplog.set_level(logging.DEBUG)
-
     folder_path: Optional[str] = None
 
     with pytest.raises(
@@ -378,8 +656,7 @@ def test_parse_folder_path_exception(base_client: BaseClient, caplog: Any) -> No
     ):
         base_client.parse_folder_path(cast(str, folder_path))
 
-    assert (
-        "Error parsing folder path: 'NoneType' object has no attribute 'strip'"
-        in caplog.text
+    assert _logged(
+        caplog, "Error parsing folder path: 'NoneType' object has no attribute 'strip'"
     )
-    assert f"Input folder_path: {folder_path}" in caplog.text
+    assert _logged(caplog, f"Input folder_path: {folder_path}")
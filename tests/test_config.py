@@ -8,25 +8,12 @@ from sharepycrud.logger import get_logger
 logger = get_logger("sharepycrud.config")
 
 
-@pytest.fixture
-def valid_config() -> SharePointConfig:
-    """
-    Returns a valid SharePointConfig instance for testing.
-    """
-    return SharePointConfig(
-        tenant_id="test-tenant-id",
-        client_id="test-client-id",
-        client_secret="test-client-secret",
-        sharepoint_url="https://test.sharepoint.com",
-    )
-
-
-def test_validate_success(valid_config: SharePointConfig, caplog: Any) -> None:
+def test_validate_success(mock_config: SharePointConfig, caplog: Any) -> None:
     """
     Test that validate returns True when all fields are provided.
     """
     caplog.set_level("DEBUG", logger="sharepycrud.config")
-    is_valid, missing_fields = valid_config.validate()
+    is_valid, missing_fields = mock_config.validate()
     assert is_valid, "Expected validation to succeed."
     assert missing_fields == [], "Expected no missing fields."
     assert "Configuration validated successfully" in caplog.text
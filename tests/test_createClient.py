@@ -1,72 +1,144 @@
 import pytest
-from unittest.mock import MagicMock, patch
-from sharepycrud.createClient import CreateClient
+from unittest.mock import Mock
 from sharepycrud.baseClient import BaseClient
-from sharepycrud.config import SharePointConfig
-from typing import Any, List, Dict, Optional
-import requests
+from sharepycrud.createClient import CreateClient
+from typing import Any, Callable, Dict, Generator, Optional, Set, Tuple, cast
 import logging
-import sys
-from pathlib import Path
-
-
-@pytest.fixture
-def mock_base_client() -> BaseClient:
-    """Mocked BaseClient instance."""
-    base_client = MagicMock(spec=BaseClient)
-    base_client.access_token = "mock_access_token"
-    base_client.config = SharePointConfig(
-        tenant_id="mock-tenant-id",
-        client_id="mock-client-id",
-        client_secret="mock-client-secret",
-        sharepoint_url="https://mock.sharepoint.com",
-    )
-    return base_client
-
-
-@pytest.fixture
-def create_client(mock_base_client: BaseClient) -> CreateClient:
-    """CreateClient initialized with a mocked BaseClient."""
-    return CreateClient(mock_base_client)
 
 
-def test_make_graph_request(create_client: CreateClient) -> None:
-    """Test delegating make_graph_request to BaseClient."""
-    with patch.object(
-        create_client.client, "make_graph_request", return_value={"key": "value"}
-    ) as mock_method:
-        result = create_client.make_graph_request(
-            "https://mock-url.com", "POST", {"data": "test"}
-        )
-        mock_method.assert_called_once_with(
-            "https://mock-url.com", "POST", {"data": "test"}
-        )
-        assert result == {"key": "value"}
-
-
-def test_format_graph_url(create_client: CreateClient) -> None:
-    """Test delegating format_graph_url to BaseClient."""
-    with patch.object(
-        create_client.client, "format_graph_url", return_value="https://mocked-url.com"
-    ) as mock_method:
-        result = create_client.format_graph_url("sites", "mock-site")
-        mock_method.assert_called_once_with("sites", "mock-site")
-        assert result == "https://mocked-url.com"
-
+@pytest.fixture(scope="module", autouse=True)
+def _create_client_log_level() -> Generator[None, None, None]:
+    """Emit CreateClient's INFO records for the whole module, then restore the level."""
+    create_logger = logging.getLogger("sharepycrud.createClient")
+    level = create_logger.level
+    create_logger.setLevel(logging.INFO)
+    yield
+    create_logger.setLevel(level)
+
+
+@pytest.fixture(scope="module")
+def create_client(shared_base_client: Any) -> CreateClient:
+    """CreateClient initialized with the module's fake BaseClient."""
+    return CreateClient(cast(BaseClient, shared_base_client))
+
+
+@pytest.fixture(autouse=True)
+def _reset_base_client(mock_base_client: Any) -> None:
+    """Reset the shared fake BaseClient after every test, even those not using it."""
+
+
+# Each creation call with the messages it logs on entry and on failure; the
+# callable receives the client and the path of a file to upload
+_CREATE_FOLDER = pytest.param(
+    lambda client, source: client.create_folder("drive123", "TestFolder"),
+    "Creating folder: TestFolder",
+    "Failed to create folder: TestFolder",
+    id="create_folder",
+)
+_CREATE_FILE = pytest.param(
+    lambda client, source: client.create_file("drive123", "folder123", "test.txt"),
+    "Creating file: test.txt",
+    "Failed to create file: test.txt",
+    id="create_file",
+)
+_UPLOAD_FILE = pytest.param(
+    lambda client, source: client.upload_file_to_folder(
+        "drive123", "folder123", "test.txt", source
+    ),
+    "Uploading file: test.txt",
+    "Failed to upload file: test.txt",
+    id="upload_file",
+)
+_CREATE_LIST = pytest.param(
+    lambda client, source: client.create_list("site123", "TestList"),
+    "Creating list: TestList",
+    "Failed to create list: TestList",
+    id="create_list",
+)
+_CREATE_DOCUMENT_LIBRARY = pytest.param(
+    lambda client, source: client.create_document_library("site123", "TestLibrary"),
+    "Creating document library: TestLibrary",
+    "Failed to create document library: TestLibrary",
+    id="create_document_library",
+)
+
+_FILE_CONTENT = b"test content"
+
+# Messages each successful or not-found call is expected to log
+_FOLDER_CREATED = frozenset(
+    {"Creating folder: TestFolder", "Successfully created folder: TestFolder"}
+)
+_FILE_CREATED = frozenset(
+    {"Creating file: test.txt", "Successfully created file: test.txt"}
+)
+_FILE_UPLOADED = frozenset(
+    {"Uploading file: test.txt", "Successfully uploaded file: test.txt"}
+)
+_UPLOAD_NOT_FOUND = frozenset({"Uploading file: test.txt", "File not found: test.txt"})
+_LIST_CREATED = frozenset(
+    {"Creating list: TestList", "Successfully created list: TestList"}
+)
+_LIBRARY_CREATED = frozenset(
+    {
+        "Creating document library: TestLibrary",
+        "Successfully created document library: TestLibrary",
+    }
+)
+
+_CREATE_CALLS = [
+    _CREATE_FOLDER,
+    _CREATE_FILE,
+    _UPLOAD_FILE,
+    _CREATE_LIST,
+    _CREATE_DOCUMENT_LIBRARY,
+]
+
+CreateCall = Callable[[CreateClient, str], Optional[str]]
+
+
+@pytest.fixture(scope="session")
+def sample_upload(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Path of a small file for upload_file_to_folder to read; never modified."""
+    test_file = tmp_path_factory.mktemp("upload") / "test.txt"
+    test_file.write_bytes(_FILE_CONTENT)
+    return str(test_file)
+
+
+def _messages(caplog: pytest.LogCaptureFixture) -> Set[str]:
+    """Messages of the captured records, without formatting the whole log."""
+    return {record.getMessage() for record in caplog.records}
+
+
+@pytest.mark.parametrize(
+    "method, args, return_value",
+    [
+        (
+            "make_graph_request",
+            ("https://mock-url.com", "POST", {"data": "test"}),
+            {"key": "value"},
+        ),
+        ("format_graph_url", ("sites", "mock-site"), "https://mocked-url.com"),
+        ("parse_folder_path", ("/Folder1/Folder2/",), ["Folder1", "Folder2"]),
+    ],
+)
+def test_delegation(
+    create_client: CreateClient,
+    mock_base_client: Any,
+    method: str,
+    args: Tuple[Any, ...],
+    return_value: Any,
+) -> None:
+    """Test that the Graph helpers delegate to BaseClient unchanged."""
+    delegate = getattr(mock_base_client, method)
+    delegate.return_value = return_value
 
-def test_parse_folder_path(create_client: CreateClient) -> None:
-    """Test delegating parse_folder_path to BaseClient."""
-    with patch.object(
-        create_client.client, "parse_folder_path", return_value=["Folder1", "Folder2"]
-    ) as mock_method:
-        result = create_client.parse_folder_path("/Folder1/Folder2/")
-        mock_method.assert_called_once_with("/Folder1/Folder2/")
-        assert result == ["Folder1", "Folder2"]
+    assert getattr(create_client, method)(*args) == return_value
+    delegate.assert_called_once_with(*args)
 
 
 def test_create_folder_success(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test successful folder creation."""
@@ -75,67 +147,15 @@ def test_create_folder_success(
         "name": "TestFolder",
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
     folder_id = create_client.create_folder("drive123", "TestFolder")
 
     assert folder_id == "folder123"
-    assert "Creating folder: TestFolder" in caplog.text
-    assert "Successfully created folder: TestFolder" in caplog.text
-
-
-def test_create_folder_no_access_token(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-
-    folder_id = create_client.create_folder("drive123", "TestFolder")
-
-    assert folder_id is None
-
-
-def test_create_folder_no_response(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when make_graph_request returns None."""
-    mock_base_client.make_graph_request.return_value = None
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    folder_id = create_client.create_folder("drive123", "TestFolder")
-
-    assert folder_id is None
-    assert "Creating folder: TestFolder" in caplog.text
-    assert "Failed to create folder: TestFolder" in caplog.text
-
-
-def test_create_folder_invalid_id(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when folder ID is not a string."""
-    mock_base_client.make_graph_request.return_value = {
-        "id": 123,  # Invalid ID type
-        "name": "TestFolder",
-    }
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    folder_id = create_client.create_folder("drive123", "TestFolder")
-
-    assert folder_id is None
-    assert "Creating folder: TestFolder" in caplog.text
-    assert "Failed to create folder: TestFolder" in caplog.text
+    assert _FOLDER_CREATED <= _messages(caplog)
 
 
 def test_create_file_success(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test successful file creation."""
@@ -144,178 +164,50 @@ def test_create_file_success(
         "name": "test.txt",
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
     file_id = create_client.create_file("drive123", "folder123", "test.txt")
 
     assert file_id == "file123"
-    assert "Creating file: test.txt" in caplog.text
-    assert "Successfully created file: test.txt" in caplog.text
-
-
-def test_create_file_no_access_token(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-
-    file_id = create_client.create_file("drive123", "folder123", "test.txt")
-
-    assert file_id is None
-
-
-def test_create_file_no_response(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when make_graph_request returns None."""
-    mock_base_client.make_graph_request.return_value = None
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    file_id = create_client.create_file("drive123", "folder123", "test.txt")
-
-    assert file_id is None
-    assert "Creating file: test.txt" in caplog.text
-    assert "Failed to create file: test.txt" in caplog.text
-
-
-def test_create_file_invalid_id(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when file ID is not a string."""
-    mock_base_client.make_graph_request.return_value = {
-        "id": 123,  # Invalid ID type
-        "name": "test.txt",
-    }
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    file_id = create_client.create_file("drive123", "folder123", "test.txt")
-
-    assert file_id is None
-    assert "Creating file: test.txt" in caplog.text
-    assert "Failed to create file: test.txt" in caplog.text
+    assert _FILE_CREATED <= _messages(caplog)
 
 
 def test_upload_file_success(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
-    tmp_path: Path,
+    sample_upload: str,
 ) -> None:
     """Test successful file upload."""
-    # Create a temporary file
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-
     mock_base_client.make_graph_request.return_value = {
         "id": "file123",
         "name": "test.txt",
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
     file_id = create_client.upload_file_to_folder(
-        "drive123", "folder123", "test.txt", str(test_file)
+        "drive123", "folder123", "test.txt", sample_upload
     )
 
     assert file_id == "file123"
-    assert "Uploading file: test.txt" in caplog.text
-    assert "Successfully uploaded file: test.txt" in caplog.text
-
-
-def test_upload_file_no_access_token(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    tmp_path: Path,
-) -> None:
-    """Test when access token is missing."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-
-    mock_base_client.access_token = None
-
-    file_id = create_client.upload_file_to_folder(
-        "drive123", "folder123", "test.txt", str(test_file)
-    )
-
-    assert file_id is None
+    assert mock_base_client.make_graph_request.call_args.kwargs["data"] == _FILE_CONTENT
+    assert _FILE_UPLOADED <= _messages(caplog)
 
 
 def test_upload_file_not_found(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test when file is not found."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
     file_id = create_client.upload_file_to_folder(
         "drive123", "folder123", "test.txt", "nonexistent.txt"
     )
 
     assert file_id is None
-    assert "Uploading file: test.txt" in caplog.text
-    assert "File not found: test.txt" in caplog.text
-
-
-def test_upload_file_no_response(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-    tmp_path: Path,
-) -> None:
-    """Test when make_graph_request returns None."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-
-    mock_base_client.make_graph_request.return_value = None
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    file_id = create_client.upload_file_to_folder(
-        "drive123", "folder123", "test.txt", str(test_file)
-    )
-
-    assert file_id is None
-    assert "Uploading file: test.txt" in caplog.text
-    assert "Failed to upload file: test.txt" in caplog.text
-
-
-def test_upload_file_invalid_id(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-    tmp_path: Path,
-) -> None:
-    """Test when file ID is not a string."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-
-    mock_base_client.make_graph_request.return_value = {
-        "id": 123,  # Invalid ID type
-        "name": "test.txt",
-    }
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    file_id = create_client.upload_file_to_folder(
-        "drive123", "folder123", "test.txt", str(test_file)
-    )
-
-    assert file_id is None
-    assert "Uploading file: test.txt" in caplog.text
-    assert "Failed to upload file: test.txt" in caplog.text
+    assert _UPLOAD_NOT_FOUND <= _messages(caplog)
 
 
 def test_create_list_success(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test successful list creation."""
@@ -324,67 +216,15 @@ def test_create_list_success(
         "displayName": "TestList",
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
     list_id = create_client.create_list("site123", "TestList")
 
     assert list_id == "list123"
-    assert "Creating list: TestList" in caplog.text
-    assert "Successfully created list: TestList" in caplog.text
-
-
-def test_create_list_no_access_token(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-
-    list_id = create_client.create_list("site123", "TestList")
-
-    assert list_id is None
-
-
-def test_create_list_no_response(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when make_graph_request returns None."""
-    mock_base_client.make_graph_request.return_value = None
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    list_id = create_client.create_list("site123", "TestList")
-
-    assert list_id is None
-    assert "Creating list: TestList" in caplog.text
-    assert "Failed to create list: TestList" in caplog.text
-
-
-def test_create_list_invalid_id(
-    create_client: CreateClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when list ID is not a string."""
-    mock_base_client.make_graph_request.return_value = {
-        "id": 123,  # Invalid ID type
-        "displayName": "TestList",
-    }
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    list_id = create_client.create_list("site123", "TestList")
-
-    assert list_id is None
-    assert "Creating list: TestList" in caplog.text
-    assert "Failed to create list: TestList" in caplog.text
+    assert _LIST_CREATED <= _messages(caplog)
 
 
 def test_create_list_custom_template(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test list creation with custom template."""
@@ -393,18 +233,15 @@ def test_create_list_custom_template(
         "displayName": "TestList",
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
     list_id = create_client.create_list("site123", "TestList", "customTemplate")
 
     assert list_id == "list123"
-    assert "Creating list: TestList" in caplog.text
-    assert "Successfully created list: TestList" in caplog.text
+    assert _LIST_CREATED <= _messages(caplog)
 
 
 def test_create_document_library_success(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test successful document library creation."""
@@ -413,39 +250,51 @@ def test_create_document_library_success(
         "displayName": "TestLibrary",
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
     library_id = create_client.create_document_library("site123", "TestLibrary")
 
     assert library_id == "lib123"
-    assert "Creating document library: TestLibrary" in caplog.text
-    assert "Successfully created document library: TestLibrary" in caplog.text
+    assert _LIBRARY_CREATED <= _messages(caplog)
 
 
-def test_create_document_library_no_access_token(
+@pytest.mark.parametrize("call, started, failed", _CREATE_CALLS)
+def test_create_no_access_token(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
+    sample_upload: str,
+    call: CreateCall,
+    started: str,
+    failed: str,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Test when access token is missing."""
+    """Test that every creation call returns None when the access token is missing."""
     mock_base_client.access_token = None
 
-    library_id = create_client.create_document_library("site123", "TestLibrary")
+    assert call(create_client, sample_upload) is None
+    messages = _messages(caplog)
+    assert started in messages
+    mock_base_client.make_graph_request.assert_not_called()
 
-    assert library_id is None
 
-
-def test_create_document_library_creation_failed(
+@pytest.mark.parametrize(
+    "graph_response",
+    [None, {"id": 123}],  # No response, then an ID that is not a string
+    ids=["no_response", "invalid_id"],
+)
+@pytest.mark.parametrize("call, started, failed", _CREATE_CALLS)
+def test_create_failure(
     create_client: CreateClient,
-    mock_base_client: MagicMock,
+    mock_graph: Mock,
+    sample_upload: str,
+    graph_response: Optional[Dict[str, Any]],
+    call: CreateCall,
+    started: str,
+    failed: str,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Test when document library creation fails."""
-    mock_base_client.make_graph_request.return_value = None
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.createClient")
-
-    library_id = create_client.create_document_library("site123", "TestLibrary")
+    """Test that every creation call returns None when Graph gives no usable ID."""
+    mock_graph.return_value = graph_response
 
-    assert library_id is None
-    assert "Creating document library: TestLibrary" in caplog.text
-    assert "Failed to create document library: TestLibrary" in caplog.text
+    assert call(create_client, sample_upload) is None
+    messages = _messages(caplog)
+    assert started in messages
+    assert failed in messages
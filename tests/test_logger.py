@@ -1,19 +1,68 @@
+import copy
 import logging
 import sys
 from io import StringIO
-from unittest.mock import patch, MagicMock
-from typing import Any, Generator
+from typing import Any, Generator, Union
 import pytest
 
 from sharepycrud.logger import setup_logging, get_logger
 from sharepycrud.loggerConfig import LogConfig, LogFormatter
 
+# Reused as setup_logging's log_file; see the log_stream fixture
+_LOG_STREAM = StringIO()
+
+_FMT = "%(levelname)s: %(message)s"
+_FORMATTER_FULL = LogFormatter(fmt=_FMT, colors=LogConfig.COLORS)
+_FORMATTER_INFO_ONLY = LogFormatter(fmt=_FMT, colors={"INFO": "\033[32m"})
+_RECORD_ERROR = logging.LogRecord(
+    "test", logging.ERROR, "", 0, "Test message", (), None
+)
+_RECORD_CRITICAL = logging.LogRecord(
+    "test", logging.CRITICAL, "", 0, "Test message", (), None
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_package_logger() -> Generator[None, None, None]:
+    """
+    Undo setup_logging's changes to the package logger after each test.
+
+    Keeps the logger state independent of test order, including under pytest-xdist.
+    """
+    package_logger = logging.getLogger("sharepycrud")
+    handlers, level = package_logger.handlers[:], package_logger.level
+    yield
+    for handler in package_logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    package_logger.handlers = handlers
+    package_logger.setLevel(level)
+
 
 @pytest.fixture
-def caplog_debug_level(caplog: Any) -> Generator[None, None, None]:
-    """Fixture that ensures caplog is capturing at DEBUG level for all tests."""
-    caplog.set_level(logging.DEBUG, logger="sharepycrud")
-    yield
+def clean_logger() -> logging.Logger:
+    """The package logger with all handlers removed; restored after the test."""
+    package_logger = logging.getLogger("sharepycrud")
+    package_logger.handlers.clear()
+    return package_logger
+
+
+@pytest.fixture
+def log_stream() -> StringIO:
+    """The module's in-memory log stream, emptied for this test."""
+    _LOG_STREAM.seek(0)
+    _LOG_STREAM.truncate(0)
+    return _LOG_STREAM
+
+
+def _force_isatty(
+    monkeypatch: pytest.MonkeyPatch, value: bool, stream: str = "stderr"
+) -> None:
+    """Make sys.<stream>.isatty() return value for the rest of the test."""
+    target = getattr(sys, stream)
+    # Under capture (and in CI) the stream already reports no TTY
+    if target.isatty() != value:
+        monkeypatch.setattr(target, "isatty", lambda: value)
 
 
 def test_get_logger_with_module_name() -> None:
@@ -25,77 +74,93 @@ def test_get_logger_with_module_name() -> None:
     assert logger2.name == "sharepycrud.test_module"
 
 
-def test_setup_logging_default(caplog: Any) -> None:
+def test_get_logger_singleton() -> None:
+    """Test that get_logger returns the same logger for a name with or without prefix."""
+    assert get_logger("test_module") is get_logger("sharepycrud.test_module")
+
+
+def test_setup_logging_default(caplog: Any, clean_logger: logging.Logger) -> None:
     """Test setup_logging with default parameters."""
     caplog.set_level(logging.DEBUG)
 
-    # Reset any existing handlers
-    root_logger = logging.getLogger("sharepycrud")
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-
     setup_logging()
 
-    assert len(root_logger.handlers) == 1, "Expected exactly one console handler"
+    assert len(clean_logger.handlers) == 1, "Expected exactly one console handler"
 
     test_logger = get_logger()
     test_logger.debug("Debug message - should not appear in caplog since level=INFO")
     test_logger.info("Info message - should appear in caplog")
 
-    assert "Debug message - should not appear" not in caplog.text
-    assert "Info message - should appear" in caplog.text
+    messages = [record.getMessage() for record in caplog.records]
+    assert not any("Debug message - should not appear" in m for m in messages)
+    assert any("Info message - should appear" in m for m in messages)
 
 
-def test_setup_logging_with_file(tmp_path: Any, caplog_debug_level: None) -> None:
-    """Test setup_logging with a file path."""
-    log_file_path = tmp_path / "test_log.log"
+@pytest.mark.parametrize(
+    "level", ["warning", "WARNING", logging.WARNING], ids=["lower", "upper", "int"]
+)
+def test_setup_logging_str_level(
+    clean_logger: logging.Logger, level: Union[int, str]
+) -> None:
+    """Test that setup_logging accepts level names in any case and numeric levels."""
+    setup_logging(level=level)
 
-    root_logger = logging.getLogger("sharepycrud")
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    assert clean_logger.level == logging.WARNING
 
-    setup_logging(level="WARNING", log_file=str(log_file_path))
+
+def test_setup_logging_with_file(
+    clean_logger: logging.Logger, log_stream: StringIO
+) -> None:
+    """Test setup_logging with an open stream as the log file."""
+    setup_logging(level="WARNING", log_file=log_stream)
 
     test_logger = get_logger()
-    assert len(root_logger.handlers) == 2, "Expected console and file handlers"
+    assert len(clean_logger.handlers) == 2, "Expected console and stream handlers"
 
     test_logger.warning("Warning message in file and console")
 
-    with open(log_file_path, "r") as f:
-        contents = f.read()
-        assert "Warning message in file and console" in contents
+    assert "Warning message in file and console" in log_stream.getvalue()
 
 
-def test_setup_logging_removes_existing_handlers(caplog: Any) -> None:
-    """Test that setup_logging removes existing handlers before adding new ones."""
-    root_logger = logging.getLogger("sharepycrud")
+def test_setup_logging_file_handler(
+    tmp_path_factory: pytest.TempPathFactory, clean_logger: logging.Logger
+) -> None:
+    """Test that a log file path is written through a FileHandler."""
+    log_file_path = tmp_path_factory.mktemp("logs") / "test_log.log"
+
+    setup_logging(level="WARNING", log_file=str(log_file_path))
+    assert isinstance(clean_logger.handlers[-1], logging.FileHandler)
 
-    # Clear existing handlers
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    get_logger().warning("Warning message on disk")
+    clean_logger.handlers[-1].flush()
 
+    assert "Warning message on disk" in log_file_path.read_text()
+
+
+def test_setup_logging_removes_existing_handlers(clean_logger: logging.Logger) -> None:
+    """Test that setup_logging removes existing handlers before adding new ones."""
     # Add multiple handlers
     handler1 = logging.StreamHandler()
     handler2 = logging.StreamHandler()
-    root_logger.addHandler(handler1)
-    root_logger.addHandler(handler2)
+    clean_logger.addHandler(handler1)
+    clean_logger.addHandler(handler2)
 
-    assert len(root_logger.handlers) == 2, "Expected two handlers before setup"
+    assert len(clean_logger.handlers) == 2, "Expected two handlers before setup"
 
     setup_logging()
 
-    assert len(root_logger.handlers) == 1, "Expected exactly one handler after setup"
-    assert handler1 not in root_logger.handlers, "Old handler should be removed"
-    assert handler2 not in root_logger.handlers, "Old handler should be removed"
+    assert len(clean_logger.handlers) == 1, "Expected exactly one handler after setup"
+    assert handler1 not in clean_logger.handlers, "Old handler should be removed"
+    assert handler2 not in clean_logger.handlers, "Old handler should be removed"
 
 
-def test_get_console_formatter_with_colors() -> None:
+def test_get_console_formatter_with_colors(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test console formatter creation with colors enabled."""
-    with patch("sys.stdout.isatty", return_value=True):
-        formatter = LogConfig.get_console_formatter(use_colors=True)
-        assert isinstance(formatter, LogFormatter)
-        assert formatter.colors == LogConfig.COLORS
-        assert formatter._fmt == "%(asctime)s %(name)s %(levelname)s - %(message)s"
+    _force_isatty(monkeypatch, True, stream="stdout")
+    formatter = LogConfig.get_console_formatter(use_colors=True)
+    assert isinstance(formatter, LogFormatter)
+    assert formatter.colors == LogConfig.COLORS
+    assert formatter._fmt == "%(asctime)s %(name)s %(levelname)s - %(message)s"
 
 
 def test_get_console_formatter_without_colors() -> None:
@@ -121,69 +186,29 @@ def test_log_formatter_initialization() -> None:
     assert formatter_no_params.colors == {}
 
 
-def test_log_formatter_color_formatting() -> None:
-    """Test that LogFormatter correctly applies color formatting."""
-    formatter = LogFormatter(fmt="%(levelname)s: %(message)s", colors=LogConfig.COLORS)
-
-    # Create a test record
-    record = logging.LogRecord(
-        name="test",
-        level=logging.ERROR,
-        pathname="",
-        lineno=0,
-        msg="Test message",
-        args=(),
-        exc_info=None,
-    )
-
-    # Test with TTY available
-    with patch("sys.stderr.isatty", return_value=True):
-        formatted = formatter.format(record)
-        expected_color = LogConfig.COLORS["ERROR"]
-        expected_reset = LogConfig.COLORS["RESET"]
-        assert f"{expected_color}ERROR{expected_reset}" in formatted
-        assert "Test message" in formatted
-
-
-def test_log_formatter_no_color_when_no_tty() -> None:
-    """Test that LogFormatter doesn't apply colors when not in a TTY."""
-    formatter = LogFormatter(fmt="%(levelname)s: %(message)s", colors=LogConfig.COLORS)
-
-    record = logging.LogRecord(
-        name="test",
-        level=logging.ERROR,
-        pathname="",
-        lineno=0,
-        msg="Test message",
-        args=(),
-        exc_info=None,
-    )
-
-    # Test without TTY
-    with patch("sys.stderr.isatty", return_value=False):
-        formatted = formatter.format(record)
-        assert "\033[" not in formatted  # No ANSI color codes
-        assert "ERROR: Test message" in formatted
-
-
-def test_log_formatter_unknown_level() -> None:
-    """Test LogFormatter behavior with unknown log level."""
-    formatter = LogFormatter(
-        fmt="%(levelname)s: %(message)s",
-        colors={"INFO": "\033[32m"},  # Only define INFO color
-    )
-
-    # Create record with custom level
-    record = logging.LogRecord(
-        name="test",
-        level=logging.CRITICAL,  # Level not in colors dict
-        pathname="",
-        lineno=0,
-        msg="Test message",
-        args=(),
-        exc_info=None,
-    )
-
-    with patch("sys.stderr.isatty", return_value=True):
-        formatted = formatter.format(record)
-        assert "CRITICAL: Test message" in formatted
+@pytest.mark.parametrize(
+    "formatter, record, isatty, expected",
+    [
+        (
+            _FORMATTER_FULL,
+            _RECORD_ERROR,
+            True,
+            f"{LogConfig.COLORS['ERROR']}ERROR{LogConfig.COLORS['RESET']}: Test message",
+        ),
+        (_FORMATTER_FULL, _RECORD_ERROR, False, "ERROR: Test message"),
+        # CRITICAL has no color of its own here
+        (_FORMATTER_INFO_ONLY, _RECORD_CRITICAL, True, "CRITICAL: Test message"),
+    ],
+    ids=["color", "no_tty", "unknown_level"],
+)
+def test_log_formatter_format(
+    monkeypatch: pytest.MonkeyPatch,
+    formatter: LogFormatter,
+    record: logging.LogRecord,
+    isatty: bool,
+    expected: str,
+) -> None:
+    """Test that LogFormatter colors the level name only on a TTY with a known color."""
+    _force_isatty(monkeypatch, isatty)
+    # format() rewrites levelname in place, so work on a copy of the shared record
+    assert formatter.format(copy.copy(record)) == expected
@@ -1,301 +1,467 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 from sharepycrud.readClient import ReadClient
 from sharepycrud.baseClient import BaseClient
-from sharepycrud.config import SharePointConfig
-from typing import Any, List, Dict, Optional
+from typing import (
+    Any,
+    Callable,
+    List,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 import requests
 import logging
-import sys
+from io import BytesIO
+from types import SimpleNamespace
+
+# Graph responses shared by several tests. Pass list_drives_and_root_contents
+# a dict() copy, since it rewrites the top level of the drive listing.
+_EMPTY_LISTING: Dict[str, List[Any]] = {"value": []}
+_DRIVE1_RESPONSE: Dict[str, List[Dict[str, str]]] = {
+    "value": [{"name": "Drive1", "id": "drive1"}]
+}
+_ROOT_FOLDER_AND_FILE: Dict[str, List[Dict[str, Any]]] = {
+    "value": [
+        {"name": "Folder1", "folder": {}},
+        {"name": "File1", "file": {}},
+    ]
+}
+_ROOT_FOLDERS_RESPONSE: Dict[str, List[Dict[str, Any]]] = {
+    "value": [
+        {
+            "name": "Folder1",
+            "id": "folder1",
+            "parentReference": {"path": "/drives/drive1"},
+            "folder": {},
+        }
+    ]
+}
+_FOLDER1_RESPONSE: Dict[str, List[Dict[str, Any]]] = {
+    "value": [
+        {
+            "name": "SubFolder1",
+            "id": "subfolder1",
+            "parentReference": {"path": "/drives/drive1/Folder1"},
+            "folder": {},
+        }
+    ]
+}
+_PARENT_FOLDERS_RESPONSE: Dict[str, List[Dict[str, Any]]] = {
+    "value": [
+        {
+            "name": "ParentFolder1",
+            "id": "folder1",
+            "parentReference": {"path": "/Drive1"},
+            "folder": {},
+        },
+        {
+            "name": "ParentFolder2",
+            "id": "folder2",
+            "parentReference": {"path": "/Drive1"},
+            "folder": {},
+        },
+    ]
+}
+
+# ReadClient calls that give up when make_graph_request returns nothing, with
+# the value each returns; every one of them also gives up without a token
+_NO_RESPONSE_CALLS = [
+    pytest.param("list_sites", (), None, id="list_sites"),
+    pytest.param("get_site_id", ("TestSite",), None, id="get_site_id"),
+    pytest.param(
+        "list_drives_and_root_contents",
+        ("site123",),
+        None,
+        id="list_drives_and_root_contents",
+    ),
+    pytest.param("list_drive_names", ("site123",), None, id="list_drive_names"),
+    pytest.param("get_drive_id", ("mock-site-id", "Drive1"), None, id="get_drive_id"),
+    pytest.param("list_all_folders", ("drive1",), [], id="list_all_folders"),
+    pytest.param("list_parent_folders", ("drive1",), None, id="list_parent_folders"),
+    pytest.param(
+        "get_folder_content",
+        ("dummy_drive_id", "dummy_folder_id"),
+        None,
+        id="get_folder_content",
+    ),
+    pytest.param(
+        "file_exists_in_folder",
+        ("drive123", "folder123", "test.txt"),
+        False,
+        id="file_exists_in_folder",
+    ),
+]
+_NO_ACCESS_TOKEN_CALLS = _NO_RESPONSE_CALLS + [
+    pytest.param(
+        "get_root_folder_id_by_name",
+        ("dummy_drive_id", "TestFolder"),
+        None,
+        id="get_root_folder_id_by_name",
+    ),
+    pytest.param(
+        "download_file", ("test.txt", "TestSite", "TestDrive"), None, id="download_file"
+    ),
+    pytest.param(
+        "download_large_file",
+        ("test.txt", "TestSite", "TestDrive", "test.txt"),
+        False,
+        id="download_large_file",
+    ),
+]
+
+
+class FakeResponse:
+    """Lightweight stand-in for a streamed requests.Response."""
+
+    __slots__ = ("status_code", "headers", "chunks", "chunk_sizes", "closed")
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        chunks: Sequence[bytes] = (),
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.chunks = chunks
+        # chunk_size of every iter_content call, in order
+        self.chunk_sizes: List[int] = []
+        self.closed = False
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        self.chunk_sizes.append(chunk_size)
+        return iter(self.chunks)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _messages(caplog: pytest.LogCaptureFixture) -> List[str]:
+    """Messages of the captured records, without formatting the whole log."""
+    return [record.getMessage() for record in caplog.records]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _read_client_log_level() -> Generator[None, None, None]:
+    """Emit ReadClient's INFO records for the whole module, then restore the level."""
+    read_logger = logging.getLogger("sharepycrud.readClient")
+    level = read_logger.level
+    read_logger.setLevel(logging.INFO)
+    yield
+    read_logger.setLevel(level)
+
+
+@pytest.fixture(scope="module")
+def _shared_read_client(shared_base_client: Any) -> ReadClient:
+    """ReadClient built once around the module's fake BaseClient."""
+    return ReadClient(cast(BaseClient, shared_base_client))
 
 
 @pytest.fixture
-def mock_base_client() -> BaseClient:
-    """Mocked BaseClient instance."""
-    base_client = MagicMock(spec=BaseClient)
-    base_client.access_token = "mock_access_token"
-    base_client.config = SharePointConfig(
-        tenant_id="mock-tenant-id",
-        client_id="mock-client-id",
-        client_secret="mock-client-secret",
-        sharepoint_url="https://mock.sharepoint.com",
-    )
-    return base_client
+def read_client(
+    _shared_read_client: ReadClient, mock_base_client: Any
+) -> Generator[ReadClient, None, None]:
+    """The module's ReadClient, with its ID cache and the fake reset after the test."""
+    yield _shared_read_client
+    _shared_read_client.invalidate_caches()
 
 
 @pytest.fixture
-def read_client(mock_base_client: BaseClient) -> ReadClient:
-    """ReadClient initialized with a mocked BaseClient."""
-    return ReadClient(mock_base_client)
-
-
-def test_make_graph_request(read_client: ReadClient) -> None:
-    """Test delegating make_graph_request to BaseClient."""
-    with patch.object(
-        read_client.client, "make_graph_request", return_value={"key": "value"}
-    ) as mock_method:
-        result = read_client.make_graph_request(
-            "https://mock-url.com", "POST", {"data": "test"}
-        )
-        mock_method.assert_called_once_with(
-            "https://mock-url.com", "POST", {"data": "test"}
-        )
-        assert result == {"key": "value"}
-
-
-def test_format_graph_url(read_client: ReadClient) -> None:
-    """Test delegating format_graph_url to BaseClient."""
-    with patch.object(
-        read_client.client, "format_graph_url", return_value="https://mocked-url.com"
-    ) as mock_method:
-        result = read_client.format_graph_url("sites", "mock-site")
-        mock_method.assert_called_once_with("sites", "mock-site")
-        assert result == "https://mocked-url.com"
-
-
-def test_parse_folder_path(read_client: ReadClient) -> None:
-    """Test delegating parse_folder_path to BaseClient."""
-    with patch.object(
-        read_client.client, "parse_folder_path", return_value=["Folder1", "Folder2"]
-    ) as mock_method:
-        result = read_client.parse_folder_path("/Folder1/Folder2/")
-        mock_method.assert_called_once_with("/Folder1/Folder2/")
-        assert result == ["Folder1", "Folder2"]
-
-
-def test_list_sites_success(read_client: ReadClient) -> None:
-    """Test listing sites successfully."""
-    mock_response = {"value": [{"name": "Site1"}, {"name": "Site2"}]}
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.list_sites()
-        assert result == ["Site1", "Site2"]
-
-
-def test_list_sites_no_sites_found(read_client: ReadClient, caplog: Any) -> None:
+def download_mocks(mock_base_client: Any, mock_graph: Mock) -> SimpleNamespace:
     """
-    Test listing sites when no sites are found (empty response).
+    Mocks for a download whose site and drive lookups succeed.
+
+    graph answers get_site_id then get_drive_id; http and head are the session's
+    get and head; url is the content URL the download is expected to request.
     """
-    caplog.set_level("INFO", logger="sharepycrud.readClient")
+    mock_graph.side_effect = [
+        {"id": "site123"},  # get_site_id response
+        {"value": [{"name": "TestDrive", "id": "drive123"}]},  # get_drive_id response
+    ]
+    return SimpleNamespace(
+        graph=mock_graph,
+        http=mock_base_client.session.get,
+        head=mock_base_client.session.head,
+        url=mock_base_client.format_graph_url.return_value,
+    )
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value={"value": []}
-    ):
-        result = read_client.list_sites()
-        assert result == []
-        assert "Found 0 sites" in caplog.text
 
+@pytest.mark.parametrize(
+    "method, args, return_value",
+    [
+        (
+            "make_graph_request",
+            ("https://mock-url.com", "POST", {"data": "test"}),
+            {"key": "value"},
+        ),
+        ("format_graph_url", ("sites", "mock-site"), "https://mocked-url.com"),
+        ("parse_folder_path", ("/Folder1/Folder2/",), ["Folder1", "Folder2"]),
+    ],
+)
+def test_delegation(
+    read_client: ReadClient,
+    mock_base_client: Any,
+    method: str,
+    args: Tuple[Any, ...],
+    return_value: Any,
+) -> None:
+    """Test that the Graph helpers delegate to BaseClient unchanged."""
+    delegate = getattr(mock_base_client, method)
+    delegate.return_value = return_value
+
+    assert getattr(read_client, method)(*args) == return_value
+    delegate.assert_called_once_with(*args)
 
-def test_list_sites_no_token(read_client: ReadClient) -> None:
-    """Test listing sites when access token is missing."""
-    read_client.client.access_token = None
-    result = read_client.list_sites()
-    assert result is None
 
+@pytest.mark.parametrize("method, args, expected", _NO_ACCESS_TOKEN_CALLS)
+def test_no_access_token(
+    read_client: ReadClient,
+    mock_base_client: Any,
+    mock_graph: Mock,
+    method: str,
+    args: Tuple[Any, ...],
+    expected: Any,
+) -> None:
+    """Test that each call gives up without a request when there is no token."""
+    mock_base_client.access_token = None
+
+    assert getattr(read_client, method)(*args) == expected
+    mock_graph.assert_not_called()
+
+
+@pytest.mark.parametrize("method, args, expected", _NO_RESPONSE_CALLS)
+def test_no_response(
+    read_client: ReadClient,
+    mock_graph: Mock,
+    method: str,
+    args: Tuple[Any, ...],
+    expected: Any,
+) -> None:
+    """Test that each call gives up when make_graph_request returns nothing."""
+    mock_graph.return_value = None
+
+    assert getattr(read_client, method)(*args) == expected
+
+
+def test_list_sites(read_client: ReadClient, mock_graph: Mock) -> None:
+    """Test listing sites."""
+    mock_graph.return_value = {"value": [{"name": "Site1"}, {"name": "Site2"}]}
+
+    assert read_client.list_sites() == ["Site1", "Site2"]
+
+
+def test_list_sites_no_sites_found(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
+    """
+    Test listing sites when no sites are found (empty response).
+    """
+    mock_graph.return_value = _EMPTY_LISTING
 
-def test_list_sites_response_none(read_client: ReadClient) -> None:
-    """Test listing sites when response is None."""
-    with patch.object(read_client.client, "make_graph_request", return_value=None):
-        result = read_client.list_sites()
-        assert result is None
+    result = read_client.list_sites()
+    assert result == []
+    messages = _messages(caplog)
+    assert "Found 0 sites" in messages
 
 
-def test_get_site_id_success(read_client: ReadClient, caplog: Any) -> None:
+def test_get_site_id_success(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
     """Test getting a site ID successfully."""
-    caplog.set_level("INFO", logger="sharepycrud.readClient")
     mock_response = {"id": "mock-site-id"}
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.get_site_id("mock-site-name")
+    mock_graph.return_value = mock_response
+
+    result = read_client.get_site_id("mock-site-name")
 
     assert result == "mock-site-id"
-    assert "Found site: mock-site-name" in caplog.text
-    assert "Site ID: mock-site-id" in caplog.text
+    messages = _messages(caplog)
+    assert "Found site: mock-site-name" in messages
+    assert "Site ID: mock-site-id" in messages
 
 
-def test_get_site_id_no_access_token(read_client: ReadClient) -> None:
-    """Test that get_site_id returns None when there is no access token."""
-    read_client.client.access_token = None
-    result = read_client.get_site_id(site_name="TestSite")
-    assert result is None
+def test_get_site_id_not_found(read_client: ReadClient, mock_graph: Mock) -> None:
+    """Test that get_site_id returns None when the site has no ID."""
+    mock_graph.return_value = {"id": None}
+
+    assert read_client.get_site_id(site_name="TestSite") is None
 
 
 def test_get_site_id_no_site_name(read_client: ReadClient, caplog: Any) -> None:
     """Test that get_site_id logs an error and returns None when site_name is empty."""
-    caplog.set_level("ERROR", logger="sharepycrud.readClient")
     result = read_client.get_site_id(site_name="")
     assert result is None
-    assert "Site name is required" in caplog.text
+    messages = _messages(caplog)
+    assert "Site name is required" in messages
 
 
-def test_get_site_id_not_found(read_client: ReadClient) -> None:
-    """Test that get_site_id returns None when the site ID is not found."""
-    mock_response = {"id": None}  # Site ID is not present
+def test_get_site_id_uses_cache(read_client: ReadClient, mock_graph: Mock) -> None:
+    """Test that a resolved site ID is reused without another request."""
+    mock_graph.return_value = {"id": "mock-site-id"}
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.get_site_id(site_name="TestSite")
+    first = read_client.get_site_id("mock-site-name")
+    second = read_client.get_site_id("mock-site-name")
 
-    assert result is None
+    assert first == second == "mock-site-id"
+    mock_graph.assert_called_once()
 
 
-def test_get_site_id_no_response(read_client: ReadClient) -> None:
-    """Test that get_site_id returns None when make_graph_request returns None."""
-    with patch.object(read_client.client, "make_graph_request", return_value=None):
-        result = read_client.get_site_id(site_name="TestSite")
+def test_get_site_id_cache_expires(
+    read_client: ReadClient, monkeypatch: Any, mock_graph: Mock
+) -> None:
+    """Test that a cached site ID is fetched again once its TTL has elapsed."""
+    now = 1000.0
+    monkeypatch.setattr("sharepycrud.readClient.time.monotonic", lambda: now)
 
-    assert result is None
+    mock_graph.return_value = {"id": "mock-site-id"}
 
+    read_client.get_site_id("mock-site-name")
+    now += 3600.0
+    read_client.get_site_id("mock-site-name")
 
-def test_list_drives_and_root_contents_success(
-    read_client: ReadClient, caplog: Any
+    assert mock_graph.call_count == 2
+
+
+def test_id_cache_evicts_least_recently_used(
+    read_client: ReadClient, monkeypatch: Any, mock_graph: Mock
 ) -> None:
-    """Test listing drives and root contents successfully."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    """Test that a full cache evicts the entry looked up least recently."""
+    monkeypatch.setattr("sharepycrud.readClient._ID_CACHE_MAXSIZE", 2)
+    mock_graph.return_value = {"id": "mock-site-id"}
 
-    mock_response: Dict[str, List[Dict[str, str]]] = {
-        "value": [{"name": "Drive1", "id": "drive-id-1"}]
-    }
-    mock_root_contents: Dict[str, List[Dict[str, Any]]] = {
-        "value": [
-            {"name": "Folder1", "folder": {}},
-            {"name": "File1", "file": {}},
-        ]
-    }
+    read_client.get_site_id("SiteA")
+    read_client.get_site_id("SiteB")
+    read_client.get_site_id("SiteA")  # hit; SiteB is now least recently used
+    read_client.get_site_id("SiteC")  # evicts SiteB
+    assert mock_graph.call_count == 3
 
-    with patch.object(
-        read_client.client,
-        "make_graph_request",
-        side_effect=[mock_response, mock_root_contents],
-    ):
-        result = read_client.list_drives_and_root_contents("site123")
-        assert result == mock_response
-        assert "Found 1 drives" in caplog.text
-        assert "Processing drive: Drive1" in caplog.text
-        assert "Drive 'Drive1' contains 1 folders and 1 files" in caplog.text
-
-
-def test_list_drives_and_root_contents_no_access_token(read_client: ReadClient) -> None:
-    """Test that list_drives_and_root_contents returns None when there is no access token."""
-    read_client.client.access_token = None
-    result = read_client.list_drives_and_root_contents(site_id="mock-site-id")
-    assert result is None
+    read_client.get_site_id("SiteA")
+    assert mock_graph.call_count == 3
+    read_client.get_site_id("SiteB")
+    assert mock_graph.call_count == 4
 
 
-def test_list_drives_and_root_contents_empty_response(
-    read_client: ReadClient, caplog: Any
+def test_get_site_id_does_not_cache_misses(
+    read_client: ReadClient, mock_graph: Mock
 ) -> None:
-    """Test listing drives and root contents when no drives are present."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    """Test that a failed lookup is not cached."""
+    mock_graph.side_effect = [None, {"id": "mock-site-id"}]
 
-    mock_response: Dict[str, List[Any]] = {"value": []}
+    assert read_client.get_site_id("mock-site-name") is None
+    assert read_client.get_site_id("mock-site-name") == "mock-site-id"
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.list_drives_and_root_contents(site_id="mock-site-id")
-        assert result == {"value": []}
-        assert "Found 0 drives" in caplog.text
 
+def test_invalidate_caches(read_client: ReadClient, mock_graph: Mock) -> None:
+    """Test that invalidate_caches forces the next lookup to hit the API."""
+    mock_graph.return_value = _DRIVE1_RESPONSE
 
-def test_list_drives_and_root_contents_no_contents(
-    read_client: ReadClient, caplog: Any
-) -> None:
-    """Test listing drives and root contents when root folders are empty."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    read_client.get_drive_id("mock-site-id", "Drive1")
+    read_client.invalidate_caches()
+    read_client.get_drive_id("mock-site-id", "Drive1")
 
-    mock_drive_response: Dict[str, List[Dict[str, str]]] = {
-        "value": [{"name": "Drive1", "id": "drive1"}]
-    }
-    mock_empty_contents: Dict[str, List[Any]] = {"value": []}
-
-    with patch.object(
-        read_client.client,
-        "make_graph_request",
-        side_effect=[mock_drive_response, mock_empty_contents],
-    ):
-        result = read_client.list_drives_and_root_contents("site123")
-        assert result == mock_drive_response
-        assert "Found 1 drives" in caplog.text
-        assert "Processing drive: Drive1" in caplog.text
-        assert "Drive 'Drive1' contains 0 folders and 0 files" in caplog.text
-
-
-def test_list_drives_and_root_contents_with_items(
-    read_client: ReadClient, caplog: Any
+    assert mock_graph.call_count == 2
+
+
+def test_get_root_folder_id_by_name_uses_cache(
+    read_client: ReadClient, mock_graph: Mock
 ) -> None:
-    """Test listing drives and root contents with items."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    """Test that a resolved root folder ID is reused without another request."""
+    mock_response = {"value": [{"name": "TestFolder", "id": "12345"}]}
 
-    mock_response: Dict[str, List[Dict[str, str]]] = {
-        "value": [
-            {"id": "drive1", "name": "Drive1"},
-        ]
-    }
-    mock_root_contents: Dict[str, List[Dict[str, Any]]] = {
-        "value": [
-            {"name": "Folder1", "folder": {}},
-            {"name": "File1", "file": {}},
-        ]
-    }
+    mock_graph.return_value = mock_response
 
-    with patch.object(
-        read_client.client,
-        "make_graph_request",
-        side_effect=[mock_response, mock_root_contents],
-    ):
-        result = read_client.list_drives_and_root_contents("site123")
-        assert result == mock_response
-        assert "Found 1 drives" in caplog.text
-        assert "Processing drive: Drive1" in caplog.text
-        assert "Drive 'Drive1' contains 1 folders and 1 files" in caplog.text
+    read_client.get_root_folder_id_by_name("drive1", "TestFolder")
+    folder_id = read_client.get_root_folder_id_by_name("drive1", "TestFolder")
 
+    assert folder_id == "12345"
+    mock_graph.assert_called_once()
 
-def test_list_drives_and_root_contents_no_items_in_root_folder(
-    read_client: ReadClient, caplog: Any
+
+@pytest.mark.parametrize(
+    "root_contents, expected_log",
+    [
+        (_ROOT_FOLDER_AND_FILE, "Drive 'Drive1' contains 1 folders and 1 files"),
+        (_EMPTY_LISTING, "Drive 'Drive1' contains 0 folders and 0 files"),
+    ],
+    ids=["with_items", "empty_root"],
+)
+def test_list_drives_and_root_contents_success(
+    read_client: ReadClient,
+    caplog: Any,
+    mock_graph: Mock,
+    root_contents: Dict[str, Any],
+    expected_log: str,
 ) -> None:
-    """
-    Test listing drives and root contents where root folder contains no items.
-    """
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    """Test listing drives and counting the folders and files in each root."""
+    mock_graph.side_effect = [dict(_DRIVE1_RESPONSE), root_contents]
 
-    mock_drive_response: Dict[str, List[Dict[str, str]]] = {
+    result = read_client.list_drives_and_root_contents("site123")
+    assert result == _DRIVE1_RESPONSE
+    messages = _messages(caplog)
+    assert "Found 1 drives" in messages
+    assert "Processing drive: Drive1" in messages
+    assert expected_log in messages
+
+
+def test_list_drives_and_root_contents_multiple_drives(
+    read_client: ReadClient,
+    mock_base_client: Any,
+    caplog: Any,
+    mock_graph: Mock,
+) -> None:
+    """Test that each drive's root contents are matched back to its drive."""
+    drives = {
         "value": [
-            {"id": "drive1", "name": "Drive1"},
+            {"name": "Drive1", "id": "drive1"},
+            {"name": "Drive2", "id": "drive2"},
         ]
     }
-    mock_empty_root_response: Dict[str, Any] = {"value": []}  # Empty root contents
+    roots = {
+        "mock_url/drives/drive1/root/children": {
+            "value": [{"name": "F", "folder": {}}]
+        },
+        "mock_url/drives/drive2/root/children": {
+            "value": [{"name": "A", "file": {}}, {"name": "B", "file": {}}]
+        },
+    }
+    mock_base_client.format_graph_url.side_effect = (
+        lambda *args, **kwargs: f"mock_url/{'/'.join(args)}"
+    )
+    mock_graph.side_effect = lambda url: roots.get(url, drives)
 
-    with patch.object(
-        read_client.client,
-        "make_graph_request",
-        side_effect=[mock_drive_response, mock_empty_root_response],
-    ):
-        result = read_client.list_drives_and_root_contents("site123")
-        assert result == mock_drive_response
-        assert "Found 1 drives" in caplog.text
-        assert "Processing drive: Drive1" in caplog.text
-        assert "Drive 'Drive1' contains 0 folders and 0 files" in caplog.text
+    result = read_client.list_drives_and_root_contents("site123")
 
+    assert result == drives
+    messages = _messages(caplog)
+    assert "Drive 'Drive1' contains 1 folders and 0 files" in messages
+    assert "Drive 'Drive2' contains 0 folders and 2 files" in messages
 
-def test_list_drives_and_root_contents_no_response(read_client: ReadClient) -> None:
-    """Test listing drives and root contents when make_graph_request returns None."""
-    with patch.object(read_client.client, "make_graph_request", return_value=None):
-        result = read_client.list_drives_and_root_contents("site123")
-        assert result is None
+
+def test_list_drives_and_root_contents_empty_response(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
+    """Test listing drives and root contents when no drives are present."""
+    mock_graph.return_value = dict(_EMPTY_LISTING)
+
+    result = read_client.list_drives_and_root_contents(site_id="mock-site-id")
+    assert result == {"value": []}
+    messages = _messages(caplog)
+    assert "Found 0 drives" in messages
 
 
 def test_list_drive_names_success(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
     caplog: pytest.LogCaptureFixture,
+    mock_graph: Mock,
 ) -> None:
     """Test successful listing of drive names."""
-    mock_base_client.make_graph_request.return_value = {
+    mock_graph.return_value = {
         "value": [
             {"name": "Documents"},
             {"name": "Shared Documents"},
@@ -303,215 +469,145 @@ def test_list_drive_names_success(
         ]
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
     drive_names = read_client.list_drive_names("site123")
 
     assert drive_names == ["Documents", "Shared Documents", "Site Assets"]
-    assert "Found 3 drives" in caplog.text
-    assert (
-        "Drive names: ['Documents', 'Shared Documents', 'Site Assets']" in caplog.text
-    )
-
-
-def test_list_drive_names_no_access_token(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-
-    drive_names = read_client.list_drive_names("site123")
-
-    assert drive_names is None
-
-
-def test_list_drive_names_no_response(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when make_graph_request returns None."""
-    mock_base_client.make_graph_request.return_value = None
-
-    drive_names = read_client.list_drive_names("site123")
-
-    assert drive_names is None
+    messages = _messages(caplog)
+    assert "Found 3 drives" in messages
+    assert "Drive names: ['Documents', 'Shared Documents', 'Site Assets']" in messages
 
 
 def test_list_drive_names_empty_list(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_graph: Mock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test when no drives are found."""
-    mock_base_client.make_graph_request.return_value = {"value": []}
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    mock_graph.return_value = _EMPTY_LISTING
 
     drive_names = read_client.list_drive_names("site123")
 
     assert drive_names == []
-    assert "Found 0 drives" in caplog.text
-    assert "Drive names: []" in caplog.text
+    messages = _messages(caplog)
+    assert "Found 0 drives" in messages
+    assert "Drive names: []" in messages
 
 
 def test_list_drive_names_missing_names(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_graph: Mock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test when some drives don't have names."""
-    mock_base_client.make_graph_request.return_value = {
+    mock_graph.return_value = {
         "value": [{"name": "Documents"}, {}, {"name": "Site Assets"}]  # Missing name
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
     drive_names = read_client.list_drive_names("site123")
 
     assert drive_names == ["Documents", None, "Site Assets"]
-    assert "Found 3 drives" in caplog.text
-    assert "Drive names: ['Documents', None, 'Site Assets']" in caplog.text
+    messages = _messages(caplog)
+    assert "Found 3 drives" in messages
+    assert "Drive names: ['Documents', None, 'Site Assets']" in messages
 
 
-def test_get_drive_id_success(read_client: ReadClient, caplog: Any) -> None:
+def test_get_drive_id_success(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
     """Test getting a drive ID successfully."""
-    caplog.set_level("INFO", logger="sharepycrud.readClient")
-    mock_response = {"value": [{"name": "Drive1", "id": "mock-drive-id"}]}
-
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.get_drive_id("mock-site-id", "Drive1")
+    mock_graph.return_value = _DRIVE1_RESPONSE
 
-    assert result == "mock-drive-id"
-    assert "Found drive: Drive1, ID: mock-drive-id" in caplog.text
+    result = read_client.get_drive_id("mock-site-id", "Drive1")
 
-
-def test_get_drive_id_no_access_token(read_client: ReadClient) -> None:
-    """Test that get_drive_id returns None when there is no access token."""
-    read_client.client.access_token = None
-    result = read_client.get_drive_id(site_id="mock-site-id", drive_name="Drive1")
-    assert result is None
+    assert result == "drive1"
+    messages = _messages(caplog)
+    assert "Found drive: Drive1, ID: drive1" in messages
 
 
-def test_get_drive_id_no_response(read_client: ReadClient) -> None:
-    """Test that get_drive_id returns None when make_graph_request returns None."""
-    with patch.object(read_client.client, "make_graph_request", return_value=None):
-        result = read_client.get_drive_id(site_id="mock-site-id", drive_name="Drive1")
-        assert result is None
-
-
-def test_get_drive_id_not_found(read_client: ReadClient, caplog: Any) -> None:
+def test_get_drive_id_not_found(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
     """Test that getting a drive ID returns None when drive is not found."""
-    caplog.set_level("INFO", logger="sharepycrud.readClient")
-    mock_response: Dict[str, List[Dict[str, str]]] = {"value": []}
+    mock_graph.return_value = _EMPTY_LISTING
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.get_drive_id("mock-site-id", "NonexistentDrive")
+    result = read_client.get_drive_id("mock-site-id", "NonexistentDrive")
 
     assert result is None
-    assert "Drive not found: NonexistentDrive" in caplog.text
-
-
-def test_list_drive_ids_with_drives(read_client: ReadClient, caplog: Any) -> None:
-    """
-    Test list_drive_ids when drives are present.
-    """
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    messages = _messages(caplog)
+    assert "Drive not found: NonexistentDrive" in messages
 
-    # Mock the make_graph_request to return drives
-    mock_response = {
-        "value": [
-            {"id": "drive1", "name": "Drive 1"},
-            {"id": "drive2", "name": "Drive 2"},
-        ]
-    }
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.list_drive_ids("site123")
-        assert result == [("drive1", "Drive 1"), ("drive2", "Drive 2")]
-        assert "Found 2 drives" in caplog.text
 
+@pytest.mark.parametrize(
+    "access_token, graph_response, expected, expected_log",
+    [
+        (
+            "mock_access_token",
+            {
+                "value": [
+                    {"id": "drive1", "name": "Drive 1"},
+                    {"id": "drive2", "name": "Drive 2"},
+                ]
+            },
+            [("drive1", "Drive 1"), ("drive2", "Drive 2")],
+            "Found 2 drives",
+        ),
+        ("mock_access_token", _EMPTY_LISTING, [], "Found 0 drives"),
+        (None, None, [], None),
+    ],
+    ids=["with_drives", "no_drives", "no_access_token"],
+)
+def test_list_drive_ids(
+    read_client: ReadClient,
+    mock_base_client: Any,
+    caplog: Any,
+    mock_graph: Mock,
+    access_token: Optional[str],
+    graph_response: Optional[Dict[str, Any]],
+    expected: List[Tuple[str, str]],
+    expected_log: Optional[str],
+) -> None:
+    """Test list_drive_ids with drives, without drives and without a token."""
+    mock_base_client.access_token = access_token
+    mock_graph.return_value = graph_response
 
-def test_list_drive_ids_no_drives(read_client: ReadClient, caplog: Any) -> None:
-    """
-    Test list_drive_ids when no drives are found.
-    """
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
-    # Mock the make_graph_request to return an empty list of drives
-    mock_response: Dict[str, List[Any]] = {"value": []}
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.list_drive_ids("site123")
-        assert result == []
-        assert "Found 0 drives" in caplog.text
+    assert read_client.list_drive_ids("site123") == expected
+    messages = _messages(caplog)
+    if expected_log is None:
+        assert not any("Found" in message for message in messages)
+    else:
+        assert expected_log in messages
 
 
-def test_list_drive_ids_no_access_token(read_client: ReadClient, caplog: Any) -> None:
+def test_list_drive_ids_follows_next_link(
+    read_client: ReadClient, mock_base_client: Any, mock_graph: Mock
+) -> None:
     """
-    Test list_drive_ids when access token is missing.
+    Test list_drive_ids collects drives from every page of a paginated response.
     """
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    mock_graph.return_value = {
+        "value": [{"id": "drive1", "name": "Drive 1"}],
+        "@odata.nextLink": "https://graph.microsoft.com/v1.0/next-page",
+    }
+    mock_base_client.iter_graph_pages.return_value = iter(
+        [{"id": "drive2", "name": "Drive 2"}]
+    )
 
-    # Remove access token to simulate missing token
-    read_client.client.access_token = None
     result = read_client.list_drive_ids("site123")
-    assert result == []
-    assert "Found" not in caplog.text
-
 
-def test_list_all_folders_with_folders(read_client: ReadClient, caplog: Any) -> None:
-    """Test list_all_folders with nested folder structure."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    assert result == [("drive1", "Drive 1"), ("drive2", "Drive 2")]
+    mock_base_client.iter_graph_pages.assert_called_once_with(
+        "https://graph.microsoft.com/v1.0/next-page"
+    )
 
-    root_response: Dict[str, List[Dict[str, Any]]] = {
-        "value": [
-            {
-                "name": "Folder1",
-                "id": "folder1",
-                "parentReference": {"path": "/drives/drive1"},
-                "folder": {},
-            }
-        ]
-    }
 
-    folder1_response: Dict[str, List[Dict[str, Any]]] = {
-        "value": [
-            {
-                "name": "SubFolder1",
-                "id": "subfolder1",
-                "parentReference": {"path": "/drives/drive1/Folder1"},
-                "folder": {},
-            }
-        ]
-    }
+def test_list_all_folders_with_folders(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
+    """Test list_all_folders with nested folder structure."""
+    # One listing per folder, in the order the walk requests them
+    mock_graph.side_effect = [_ROOT_FOLDERS_RESPONSE, _FOLDER1_RESPONSE, _EMPTY_LISTING]
 
-    subfolder1_response: Dict[str, List[Dict[str, Any]]] = {"value": []}
-    call_count = 0
-
-    # Define a mock function to simulate make_graph_request to prevent recursion
-    def mock_make_graph_request(*args: Any, **kwargs: Any) -> Dict[str, Any]:
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            return root_response
-        elif call_count == 2:
-            return folder1_response
-        else:
-            return subfolder1_response
-
-    call_count = 0
-    with patch.object(
-        read_client.client, "make_graph_request", side_effect=mock_make_graph_request
-    ):
-        result = read_client.list_all_folders("drive1")
+    result = read_client.list_all_folders("drive1")
 
     expected: List[Dict[str, Any]] = [
         {"name": "Folder1", "id": "folder1", "path": "/drives/drive1/Folder1"},
@@ -523,106 +619,84 @@ def test_list_all_folders_with_folders(read_client: ReadClient, caplog: Any) ->
     ]
 
     assert result == expected
-    assert "Processing folder: Folder1 at level 0" in caplog.text
-    assert "Processing folder: SubFolder1 at level 1" in caplog.text
-    assert "Found 1 subfolders in Folder1" in caplog.text
-
-
-def test_list_all_folders_empty(read_client: ReadClient) -> None:
-    """Test list_all_folders when no folders exist."""
-    mock_response: Dict[str, List[Any]] = {"value": []}
+    messages = _messages(caplog)
+    assert "Processing folder: Folder1 at level 0" in messages
+    assert "Processing folder: SubFolder1 at level 1" in messages
+    assert "Found 1 subfolders in Folder1" in messages
+    assert mock_graph.call_count == 3
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.list_all_folders("drive1")
 
-    assert result == []
+def test_list_all_folders_breadth_first(
+    read_client: ReadClient, mock_base_client: Any, mock_graph: Mock
+) -> None:
+    """Test that list_all_folders returns each level before descending."""
+
+    def folder(name: str, parent: str) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "id": name,
+            "parentReference": {"path": parent},
+            "folder": {},
+        }
+
+    children = {
+        "root": [folder("A", "/r"), folder("B", "/r")],
+        "A": [folder("A1", "/r/A")],
+        "B": [folder("B1", "/r/B")],
+    }
+    mock_base_client.format_graph_url.side_effect = lambda *args, **kwargs: args[3]
+    mock_graph.side_effect = lambda url: {"value": children.get(url, [])}
 
+    result = read_client.list_all_folders("drive1")
 
-def test_list_all_folders_no_response(read_client: ReadClient) -> None:
-    """Test list_all_folders when make_graph_request returns None."""
-    with patch.object(read_client.client, "make_graph_request", return_value=None):
-        result = read_client.list_all_folders("drive1")
+    assert [f["name"] for f in result] == ["A", "B", "A1", "B1"]
+    assert [f["path"] for f in result] == ["/r/A", "/r/B", "/r/A/A1", "/r/B/B1"]
 
-    assert result == []
 
+def test_list_all_folders_empty(read_client: ReadClient, mock_graph: Mock) -> None:
+    """Test that list_all_folders returns an empty list for an empty drive."""
+    mock_graph.return_value = _EMPTY_LISTING
 
-def test_list_all_folders_no_access_token(read_client: ReadClient) -> None:
-    """Test list_all_folders when access token is missing."""
-    read_client.client.access_token = None
-    result = read_client.list_all_folders("drive1")
-    assert result == []
+    assert read_client.list_all_folders("drive1") == []
 
 
-def test_list_parent_folders_success(read_client: ReadClient, caplog: Any) -> None:
+def test_list_parent_folders_success(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
     """Test that list_parent_folders returns the correct parent folders."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
-    mock_response = {
-        "value": [
-            {
-                "name": "ParentFolder1",
-                "id": "folder1",
-                "parentReference": {"path": "/Drive1"},
-                "folder": {},
-            },
-            {
-                "name": "ParentFolder2",
-                "id": "folder2",
-                "parentReference": {"path": "/Drive1"},
-                "folder": {},
-            },
-        ]
-    }
+    mock_graph.return_value = _PARENT_FOLDERS_RESPONSE
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.list_parent_folders("drive1")
+    result = read_client.list_parent_folders("drive1")
 
     expected = [
         {"name": "ParentFolder1", "path": "/Drive1/ParentFolder1"},
         {"name": "ParentFolder2", "path": "/Drive1/ParentFolder2"},
     ]
     assert result == expected
-    assert "Found parent folder: ParentFolder1" in caplog.text
-    assert "Found parent folder: ParentFolder2" in caplog.text
-    assert "Found 2 parent folders" in caplog.text
-
-
-def test_list_parent_folders_no_access_token(read_client: ReadClient) -> None:
-    """Test that list_parent_folders returns None if no access token is present."""
-    read_client.client.access_token = None
-    result = read_client.list_parent_folders("drive1")
-    assert result is None
-
-
-def test_list_parent_folders_no_response(read_client: ReadClient) -> None:
-    """Test that list_parent_folders returns None when make_graph_request returns None."""
-    with patch.object(read_client.client, "make_graph_request", return_value=None):
-        result = read_client.list_parent_folders("drive1")
-    assert result is None
+    messages = _messages(caplog)
+    assert "Found parent folder: ParentFolder1" in messages
+    assert "Found parent folder: ParentFolder2" in messages
+    assert "Found 2 parent folders" in messages
 
 
-def test_list_parent_folders_empty(read_client: ReadClient, caplog: Any) -> None:
+def test_list_parent_folders_empty(
+    read_client: ReadClient, caplog: Any, mock_graph: Mock
+) -> None:
     """Test that list_parent_folders handles no folders correctly."""
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-    mock_response: Dict[str, List[Any]] = {"value": []}
+    mock_graph.return_value = _EMPTY_LISTING
 
-    with patch.object(
-        read_client.client, "make_graph_request", return_value=mock_response
-    ):
-        result = read_client.list_parent_folders("drive1")
+    result = read_client.list_parent_folders("drive1")
 
     assert result == []
-    assert "Found 0 parent folders" in caplog.text
+    messages = _messages(caplog)
+    assert "Found 0 parent folders" in messages
 
 
 def test_get_root_folder_id_by_name_success(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
+    mock_graph: Mock,
 ) -> None:
     """Test successful retrieval of root folder ID by name."""
     # Mocking client responses with proper typing
@@ -633,62 +707,43 @@ def test_get_root_folder_id_by_name_success(
         ]
     }
 
-    mock_base_client.format_graph_url = MagicMock(return_value="mock_url")
-    mock_base_client.make_graph_request = MagicMock(return_value=mock_response)
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    mock_base_client.format_graph_url.return_value = "mock_url"
+    mock_graph.return_value = mock_response
 
     folder_id = read_client.get_root_folder_id_by_name("dummy_drive_id", "TestFolder")
 
     # Assertions
     assert folder_id == "12345"
-    assert "Found folder: TestFolder, ID: 12345" in caplog.text
-
-
-def test_get_root_folder_id_by_name_no_access_token(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
-    folder_id = read_client.get_root_folder_id_by_name("dummy_drive_id", "TestFolder")
-
-    # Assertions
-    assert folder_id is None
-    assert "Found folder:" not in caplog.text
+    messages = _messages(caplog)
+    assert "Found folder: TestFolder, ID: 12345" in messages
 
 
 def test_get_root_folder_id_by_name_folder_not_found(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
+    mock_graph: Mock,
 ) -> None:
     mock_base_client.format_graph_url.return_value = "mock_url"
-    mock_base_client.make_graph_request.return_value = {
-        "value": [{"name": "OtherFolder", "id": "67890"}]
-    }
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    mock_graph.return_value = {"value": [{"name": "OtherFolder", "id": "67890"}]}
 
     folder_id = read_client.get_root_folder_id_by_name("dummy_drive_id", "TestFolder")
 
     # Assertions
     assert folder_id is None
-    assert "Found folder:" not in caplog.text
+    messages = _messages(caplog)
+    assert not any("Found folder:" in message for message in messages)
 
 
 def test_get_folder_content_success(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
+    mock_graph: Mock,
 ) -> None:
     """Test successful retrieval of folder contents."""
     mock_base_client.format_graph_url.return_value = "mock_url"
-    mock_base_client.make_graph_request.return_value = {
+    mock_graph.return_value = {
         "value": [
             {
                 "id": "123",
@@ -705,8 +760,6 @@ def test_get_folder_content_success(
         ]
     }
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
     folder_contents = read_client.get_folder_content(
         "dummy_drive_id", "dummy_folder_id"
     )
@@ -727,324 +780,371 @@ def test_get_folder_content_success(
             "size": "N/A",
         },
     ]
-    assert "Found 1 folders and 1 files" in caplog.text
-
-
-def test_get_folder_content_no_access_token(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-    folder_contents = read_client.get_folder_content(
-        "dummy_drive_id", "dummy_folder_id"
-    )
-    assert folder_contents is None
-
-
-def test_get_folder_content_no_response(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when make_graph_request returns None."""
-    mock_base_client.format_graph_url.return_value = "mock_url"
-    mock_base_client.make_graph_request.return_value = None
-
-    folder_contents = read_client.get_folder_content(
-        "dummy_drive_id", "dummy_folder_id"
-    )
-    assert folder_contents is None
+    messages = _messages(caplog)
+    assert "Found 1 folders and 1 files" in messages
 
 
 def test_get_nested_folder_info_success(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
+    mock_graph: Mock,
 ) -> None:
     """Test successful nested folder traversal."""
-    mock_base_client.format_graph_url = MagicMock(
-        side_effect=lambda *args: f"mock_url/{'/'.join(args)}"
-    )
-    mock_base_client.make_graph_request = MagicMock(
-        side_effect=[
-            {
-                "value": [
-                    {"id": "123", "name": "Folder1", "folder": {}, "extra": "data"}
-                ]
-            },
-            {
-                "value": [
-                    {"id": "456", "name": "SubFolder", "folder": {}, "extra": "data"}
-                ]
-            },
-        ]
+    mock_base_client.format_graph_url.side_effect = (
+        lambda *args, **kwargs: f"mock_url/{'/'.join(args)}"
     )
+    mock_graph.side_effect = [
+        {"value": [{"id": "123", "name": "Folder1", "folder": {}, "extra": "data"}]},
+        {"value": [{"id": "456", "name": "SubFolder", "folder": {}, "extra": "data"}]},
+    ]
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
-    with patch.object(
-        read_client, "parse_folder_path", return_value=["Folder1", "SubFolder"]
-    ):
-        folder_info = read_client.get_nested_folder_info(
-            "dummy_drive_id", "Folder1/SubFolder"
-        )
-
-    assert folder_info == {"id": "456", "name": "SubFolder"}
-    assert "Processing folder: Folder1" in caplog.text
-    assert "Processing folder: SubFolder" in caplog.text
-    assert "Found deepest folder: SubFolder" in caplog.text
-
+    mock_base_client.parse_folder_path.return_value = ["Folder1", "SubFolder"]
 
-def test_get_nested_folder_info_no_access_token(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
     folder_info = read_client.get_nested_folder_info(
         "dummy_drive_id", "Folder1/SubFolder"
     )
-    assert folder_info is None
-
-
-def test_get_nested_folder_info_no_response(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when make_graph_request returns None."""
-    mock_base_client.format_graph_url = MagicMock(return_value="mock_url")
-    mock_base_client.make_graph_request = MagicMock(return_value=None)
-
-    with patch.object(read_client, "parse_folder_path", return_value=["Folder1"]):
-        folder_info = read_client.get_nested_folder_info("dummy_drive_id", "Folder1")
-
-    assert folder_info is None
 
-
-def test_get_nested_folder_info_folder_not_found(
+    assert folder_info == {"id": "456", "name": "SubFolder"}
+    messages = _messages(caplog)
+    assert "Processing folder: Folder1" in messages
+    assert "Processing folder: SubFolder" in messages
+    assert "Found deepest folder: SubFolder" in messages
+
+
+@pytest.mark.parametrize(
+    "access_token, folder_names, graph_response, expected_log",
+    [
+        (None, ["Folder1", "SubFolder"], None, None),
+        ("mock_access_token", ["Folder1"], None, None),
+        (
+            "mock_access_token",
+            ["Folder1"],
+            {"value": [{"id": "123", "name": "DifferentFolder", "folder": {}}]},
+            "Folder not found: Folder1",
+        ),
+        ("mock_access_token", [], None, None),
+    ],
+    ids=["no_access_token", "no_response", "folder_not_found", "empty_path"],
+)
+def test_get_nested_folder_info_returns_none(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
+    mock_graph: Mock,
     caplog: pytest.LogCaptureFixture,
+    access_token: Optional[str],
+    folder_names: List[str],
+    graph_response: Optional[Dict[str, Any]],
+    expected_log: Optional[str],
 ) -> None:
-    """Test when folder is not found in the response."""
-    mock_base_client.format_graph_url = MagicMock(return_value="mock_url")
-    mock_base_client.make_graph_request = MagicMock(
-        return_value={"value": [{"id": "123", "name": "DifferentFolder", "folder": {}}]}
-    )
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-
-    with patch.object(read_client, "parse_folder_path", return_value=["Folder1"]):
-        folder_info = read_client.get_nested_folder_info("dummy_drive_id", "Folder1")
-
-    assert folder_info is None
-    assert "Folder not found: Folder1" in caplog.text
-
-
-def test_get_nested_folder_info_empty_path(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when folder path is empty."""
-    with patch.object(read_client, "parse_folder_path", return_value=[]):
-        folder_info = read_client.get_nested_folder_info("dummy_drive_id", "")
+    """Test that get_nested_folder_info returns None when any folder is unresolved."""
+    mock_base_client.access_token = access_token
+    mock_base_client.format_graph_url.return_value = "mock_url"
+    mock_base_client.parse_folder_path.return_value = folder_names
+    mock_graph.return_value = graph_response
 
-    assert folder_info is None
+    folder_path = "/".join(folder_names)
+    assert read_client.get_nested_folder_info("dummy_drive_id", folder_path) is None
+    messages = _messages(caplog)
+    if expected_log:
+        assert expected_log in messages
 
 
 def test_file_exists_in_folder_found(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
     caplog: pytest.LogCaptureFixture,
+    mock_graph: Mock,
 ) -> None:
     """Test when file is found in folder."""
-    mock_base_client.make_graph_request.return_value = {
-        "value": [
-            {
-                "name": "test.txt",
-                "file": {},
-            }
-        ]
-    }
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    mock_base_client.format_graph_url.return_value = "mock_url"
+    mock_graph.return_value = {"id": "file123", "file": {}}
 
     result = read_client.file_exists_in_folder("drive123", "folder123", "test.txt")
 
     assert result is True
-    assert "Found file: test.txt" in caplog.text
+    messages = _messages(caplog)
+    assert "Found file: test.txt" in messages
+    mock_base_client.format_graph_url.assert_called_once_with(
+        "drives/drive123/items/folder123:", "test.txt", query={"$select": "id,file"}
+    )
+    # A 404 is an expected answer, so make_graph_request must not log it as an error
+    mock_graph.assert_called_once_with("mock_url", allowed_statuses=(404,))
 
 
-def test_file_exists_in_folder_not_found(
+def test_file_exists_in_folder_item_is_folder(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_graph: Mock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    """Test when file is not found in folder."""
-    mock_base_client.make_graph_request.return_value = {
-        "value": [
-            {
-                "name": "other.txt",
-                "file": {},
-            }
-        ]
-    }
-
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
+    """Test when the name resolves to a folder rather than a file."""
+    mock_graph.return_value = {"id": "folder456"}
 
     result = read_client.file_exists_in_folder("drive123", "folder123", "test.txt")
 
     assert result is False
-    assert "File not found: test.txt" in caplog.text
+    messages = _messages(caplog)
+    assert "File not found: test.txt" in messages
 
 
-def test_file_exists_in_folder_no_access_token(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
+def test_file_exists_in_folder_other_http_error(
+    read_client: ReadClient, mock_graph: Mock
 ) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-
-    result = read_client.file_exists_in_folder("drive123", "folder123", "test.txt")
-
-    assert result is False
-
-
-def test_file_exists_in_folder_no_response(
+    """Test that HTTP errors other than 404 are re-raised."""
+    mock_graph.side_effect = requests.exceptions.HTTPError("500 Server Error")
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        read_client.file_exists_in_folder("drive123", "folder123", "test.txt")
+
+
+@pytest.mark.parametrize(
+    "status_code, expected, expected_log",
+    [
+        (200, b"file content", "Successfully downloaded: test.txt"),
+        (404, None, "File not found: test.txt"),
+        (500, None, "Failed to download: test.txt"),
+    ],
+    ids=["success", "not_found", "download_failed"],
+)
+def test_download_file(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    download_mocks: SimpleNamespace,
+    caplog: pytest.LogCaptureFixture,
+    status_code: int,
+    expected: Optional[bytes],
+    expected_log: str,
 ) -> None:
-    """Test when make_graph_request returns None."""
-    mock_base_client.make_graph_request.return_value = None
+    """Test download_file for a successful, missing and failed content request."""
+    response = FakeResponse(status_code, [b"file ", b"content"])
+    download_mocks.http.return_value = response
 
-    result = read_client.file_exists_in_folder("drive123", "folder123", "test.txt")
+    result = read_client.download_file("test.txt", "TestSite", "TestDrive")
 
-    assert result is False
+    assert result == expected
+    download_mocks.http.assert_called_once_with(download_mocks.url, stream=True)
+    # The body is only read for a 200, but the response is always released
+    assert bool(response.chunk_sizes) is (status_code == 200)
+    assert response.closed
+    messages = _messages(caplog)
+    assert expected_log in messages
 
 
-def test_download_file_success(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-    caplog: pytest.LogCaptureFixture,
+def test_download_file_to_streams_chunks(
+    read_client: ReadClient, download_mocks: SimpleNamespace
 ) -> None:
-    """Test successful file download."""
-    # Mock responses for each step
-    mock_base_client.make_graph_request.side_effect = [
-        {"id": "site123"},  # get_site_id response
-        {"value": [{"name": "TestDrive", "id": "drive123"}]},  # get_drive_id response
-        {"value": [{"name": "test.txt", "id": "file123"}]},  # list_response
-    ]
+    """Test that download_file_to writes each chunk to the destination."""
+    response = FakeResponse(200, [b"chunk1", b"chunk2"])
+    download_mocks.http.return_value = response
 
-    # Mock the download request
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.content = b"file content"
-
-    with patch("requests.get", return_value=mock_response):
-        caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-        result = read_client.download_file("test.txt", "TestSite", "TestDrive")
+    dest = BytesIO()
+    result = read_client.download_file_to(
+        "test.txt", "TestSite", "TestDrive", dest, chunk_size=6
+    )
 
-    assert result == b"file content"
-    assert "Found file: test.txt" in caplog.text
-    assert "Successfully downloaded: test.txt" in caplog.text
+    assert result is True
+    assert dest.getvalue() == b"chunk1chunk2"
+    assert response.chunk_sizes == [6]
 
 
-def test_download_file_no_access_token(
+def test_download_file_uses_path_addressed_url(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_base_client: Any,
+    download_mocks: SimpleNamespace,
 ) -> None:
-    """Test when access token is missing."""
-    mock_base_client.access_token = None
-    result = read_client.download_file("test.txt", "TestSite", "TestDrive")
-    assert result is None
-
+    """Test that the content URL addresses the file by its path in the drive."""
+    download_mocks.http.return_value = FakeResponse(200, [b"content"])
 
-def test_download_file_no_list_response(
-    read_client: ReadClient,
-    mock_base_client: MagicMock,
-) -> None:
-    """Test when list_response is None."""
-    mock_base_client.make_graph_request.side_effect = [
-        {"id": "site123"},  # get_site_id response
-        {"value": [{"name": "TestDrive", "id": "drive123"}]},  # get_drive_id response
-        None,  # list_response is None
-    ]
+    read_client.download_file("/Reports/Q1 report.txt", "TestSite", "TestDrive")
 
-    result = read_client.download_file("test.txt", "TestSite", "TestDrive")
-    assert result is None
+    mock_base_client.format_graph_url.assert_called_with(
+        "drives/drive123/root:/Reports/Q1%20report.txt:", "content"
+    )
+    assert download_mocks.graph.call_count == 2
 
 
 def test_download_file_site_not_found(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_graph: Mock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test when site is not found."""
-    mock_base_client.make_graph_request.return_value = None
+    mock_graph.return_value = None
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
     result = read_client.download_file("test.txt", "NonexistentSite", "TestDrive")
 
     assert result is None
-    assert "Site not found: NonexistentSite" in caplog.text
+    messages = _messages(caplog)
+    assert "Site not found: NonexistentSite" in messages
 
 
 def test_download_file_drive_not_found(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    mock_graph: Mock,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test when drive is not found."""
-    mock_base_client.make_graph_request.side_effect = [
+    mock_graph.side_effect = [
         {"id": "site123"},  # get_site_id response
-        {"value": []},  # empty drive list
+        _EMPTY_LISTING,  # empty drive list
     ]
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
     result = read_client.download_file("test.txt", "TestSite", "NonexistentDrive")
 
     assert result is None
-    assert "Drive not found: NonexistentDrive" in caplog.text
+    messages = _messages(caplog)
+    assert "Drive not found: NonexistentDrive" in messages
+
+
+def _range_bounds(range_header: str) -> Tuple[int, int]:
+    """Start and end offsets of a "bytes=start-end" Range header."""
+    start, end = range_header[len("bytes=") :].split("-")
+    return int(start), int(end)
+
+
+def _ranged_response(content: bytes, range_header: str) -> FakeResponse:
+    """Build a 206 response holding the requested slice of content."""
+    start, end = _range_bounds(range_header)
+    return FakeResponse(
+        206,
+        [content[start : end + 1]],
+        headers={"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+    )
+
+
+def _partial_body(range_header: str, body: bytes) -> FakeResponse:
+    """206 for the requested range of an 8-byte file, whatever its body length."""
+    start, end = _range_bounds(range_header)
+    return FakeResponse(
+        206, [body], headers={"Content-Range": f"bytes {start}-{end}/8"}
+    )
 
 
-def test_download_file_not_found(
+def test_download_large_file_parallel_ranges(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    download_mocks: SimpleNamespace,
     caplog: pytest.LogCaptureFixture,
+    tmp_path: Any,
 ) -> None:
-    """Test when file is not found."""
-    mock_base_client.make_graph_request.side_effect = [
-        {"id": "site123"},  # get_site_id response
-        {"value": [{"name": "TestDrive", "id": "drive123"}]},  # get_drive_id response
-        {"value": []},  # empty file list
-    ]
+    """Test that download_large_file assembles concurrent ranges in order."""
+    content = b"0123456789"
+    download_mocks.head.return_value = FakeResponse(
+        200, headers={"Content-Length": str(len(content)), "Accept-Ranges": "bytes"}
+    )
+    download_mocks.http.side_effect = lambda url, headers, stream: (
+        _ranged_response(content, headers["Range"])
+    )
+    dest_path = tmp_path / "test.txt"
 
-    caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-    result = read_client.download_file("nonexistent.txt", "TestSite", "TestDrive")
+    result = read_client.download_large_file(
+        "test.txt", "TestSite", "TestDrive", str(dest_path), part_size=4
+    )
+
+    assert result is True
+    assert dest_path.read_bytes() == content
+    requested = sorted(
+        call.kwargs["headers"]["Range"] for call in download_mocks.http.call_args_list
+    )
+    assert requested == ["bytes=0-3", "bytes=4-7", "bytes=8-9"]
+    messages = _messages(caplog)
+    assert "Downloading test.txt in 3 parts" in messages
+    assert "Successfully downloaded: test.txt" in messages
 
-    assert result is None
-    assert "File not found: nonexistent.txt" in caplog.text
 
+def test_download_large_file_without_range_support(
+    read_client: ReadClient,
+    download_mocks: SimpleNamespace,
+    tmp_path: Any,
+) -> None:
+    """Test that download_large_file streams in one request without range support."""
+    download_mocks.head.return_value = FakeResponse(
+        200, headers={"Content-Length": "100"}
+    )
+    download_mocks.http.return_value = FakeResponse(200, [b"file content"])
+    dest_path = tmp_path / "test.txt"
 
-def test_download_file_download_failed(
+    result = read_client.download_large_file(
+        "test.txt", "TestSite", "TestDrive", str(dest_path), part_size=4
+    )
+
+    assert result is True
+    assert dest_path.read_bytes() == b"file content"
+    download_mocks.http.assert_called_once()
+    assert "headers" not in download_mocks.http.call_args.kwargs
+
+
+@pytest.mark.parametrize(
+    "range_response",
+    [
+        lambda range_header: FakeResponse(500),
+        lambda range_header: _partial_body(range_header, b"01"),
+        lambda range_header: _partial_body(range_header, b"012345"),
+        lambda range_header: FakeResponse(
+            206, [b"0123"], headers={"Content-Range": "bytes 0-3/8"}
+        ),
+    ],
+    ids=["server_error", "short_body", "long_body", "wrong_content_range"],
+)
+def test_download_large_file_range_failed(
     read_client: ReadClient,
-    mock_base_client: MagicMock,
+    download_mocks: SimpleNamespace,
     caplog: pytest.LogCaptureFixture,
+    tmp_path: Any,
+    range_response: Callable[[str], FakeResponse],
 ) -> None:
-    """Test when download request fails."""
-    mock_base_client.make_graph_request.side_effect = [
-        {"id": "site123"},  # get_site_id response
-        {"value": [{"name": "TestDrive", "id": "drive123"}]},  # get_drive_id response
-        {"value": [{"name": "test.txt", "id": "file123"}]},  # list_response
-    ]
+    """Test that a failed, truncated or misplaced range fails the whole download."""
+    download_mocks.head.return_value = FakeResponse(
+        200, headers={"Content-Length": "8", "Accept-Ranges": "bytes"}
+    )
+    download_mocks.http.side_effect = lambda url, headers, stream: range_response(
+        headers["Range"]
+    )
 
-    # Mock failed download request
-    mock_response = MagicMock()
-    mock_response.status_code = 404
+    result = read_client.download_large_file(
+        "test.txt", "TestSite", "TestDrive", str(tmp_path / "test.txt"), part_size=4
+    )
+
+    assert result is False
+    # Neither the destination nor the partial download is left behind
+    assert list(tmp_path.iterdir()) == []
+    messages = _messages(caplog)
+    assert "Failed to download: test.txt" in messages
+
+
+def _drop_second_range(url: str, headers: Dict[str, str], stream: bool) -> Any:
+    """Serve the first range of b"01234567" and drop the connection on the second."""
+    if headers["Range"] == "bytes=4-7":
+        raise requests.exceptions.ConnectionError("Connection dropped")
+    return _ranged_response(b"01234567", headers["Range"])
+
+
+@pytest.mark.parametrize(
+    "head_error, http_side_effect",
+    [
+        (None, _drop_second_range),
+        (requests.exceptions.ConnectionError, None),
+    ],
+    ids=["range_raises", "head_raises"],
+)
+def test_download_large_file_request_error(
+    read_client: ReadClient,
+    download_mocks: SimpleNamespace,
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Any,
+    head_error: Optional[Type[Exception]],
+    http_side_effect: Any,
+) -> None:
+    """Test that a request error during the download returns False instead of raising."""
+    download_mocks.head.return_value = FakeResponse(
+        200, headers={"Content-Length": "8", "Accept-Ranges": "bytes"}
+    )
+    download_mocks.head.side_effect = head_error
+    download_mocks.http.side_effect = http_side_effect
 
-    with patch("requests.get", return_value=mock_response):
-        caplog.set_level(logging.INFO, logger="sharepycrud.readClient")
-        result = read_client.download_file("test.txt", "TestSite", "TestDrive")
+    result = read_client.download_large_file(
+        "test.txt", "TestSite", "TestDrive", str(tmp_path / "test.txt"), part_size=4
+    )
 
-    assert result is None
-    assert "Failed to download: test.txt" in caplog.text
+    assert result is False
+    assert list(tmp_path.iterdir()) == []
+    messages = _messages(caplog)
+    assert "Failed to download: test.txt" in messages
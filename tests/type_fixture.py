@@ -1,8 +0,0 @@
-# from typing import TypeVar, Callable
-# import pytest
-
-# T = TypeVar("T")
-
-
-# def typed_fixture(func: Callable[..., T]) -> Callable[..., T]:
-#     return pytest.fixture(func)